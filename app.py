@@ -1,12 +1,14 @@
 import streamlit as st
-from PIL import Image
+from PIL import Image, ImageOps
 import io
 import base64
 import re
 import zipfile
 import os
 import json
-from collections import Counter
+import functools
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, urljoin
 import numpy as np
 from huggingface_hub import InferenceClient
@@ -27,8 +29,6 @@ except Exception:
     pass
 
 import db
-import importlib
-importlib.reload(db)
 
 # Initialize database on first run
 db.init_db()
@@ -60,20 +60,36 @@ def resize_and_crop(img, target_width, target_height):
     return img
 
 def fix_exif_orientation(img):
-    """Apply EXIF orientation rotation if present."""
+    """Apply EXIF orientation (all 8 rotations/mirrors) if present."""
     try:
-        exif = img._getexif()
-        if exif and 274 in exif:
-            orientation = exif[274]
-            if orientation == 3:
-                img = img.rotate(180, expand=True)
-            elif orientation == 6:
-                img = img.rotate(-90, expand=True)
-            elif orientation == 8:
-                img = img.rotate(90, expand=True)
+        return ImageOps.exif_transpose(img)
     except Exception:
-        pass
-    return img
+        return img
+
+FieldKeys = namedtuple('FieldKeys', [
+    'uploader', 'persisted', 'alt', 'alt_prev', 'alt_source', 'auto_generated',
+    'pending_alt', 'opacity', 'overlay_saved', 'saved_fp', 'convert_bw', 'bw_converted', 'bw_fp',
+])
+
+@functools.lru_cache(maxsize=128)
+def field_keys(restaurant, name):
+    """Return the session_state keys used by an image field (built once per restaurant/field)."""
+    base = f"{restaurant}_{name}"
+    return FieldKeys(
+        uploader=base,
+        persisted=f"{base}_persisted",
+        alt=f"{base}_alt",
+        alt_prev=f"{base}_alt_prev",
+        alt_source=f"{base}_alt_source",
+        auto_generated=f"{base}_auto_generated",
+        pending_alt=f"{base}_pending_alt",
+        opacity=f"{base}_opacity",
+        overlay_saved=f"{base}_overlay_saved",
+        saved_fp=f"{base}_saved_fp",
+        convert_bw=f"{base}_convert_bw",
+        bw_converted=f"{base}_bw_converted",
+        bw_fp=f"{base}_bw_fp",
+    )
 
 def make_image_filename(restaurant, field_name, width, height, ext, alt_text=''):
     """Generate WordPress-style filename: Restaurant_Field_alt_text_snippet_WxH.ext
@@ -94,20 +110,66 @@ def is_black_and_white(img, threshold=0.1):
     bw_mask = (np.abs(r - g) < limit) & (np.abs(g - b) < limit)
     return bw_mask.mean() > 0.8
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def _is_bw_cached(file_bytes):
+    """Cached is_black_and_white keyed on the uploaded file's bytes.
+
+    Classifies a small thumbnail — the colour ratio is the same at a fraction of the pixels.
+    """
+    img = Image.open(io.BytesIO(file_bytes))
+    img.thumbnail((256, 256), Image.Resampling.BILINEAR, reducing_gap=3.0)
+    return is_black_and_white(img)
+
 def apply_black_overlay(img, opacity_percent):
     """Apply a semi-transparent black overlay to image."""
     img_rgba = img.convert('RGBA')
     overlay = Image.new('RGBA', img_rgba.size, (0, 0, 0, int(255 * opacity_percent / 100)))
     return Image.alpha_composite(img_rgba, overlay).convert('RGB')
 
+def make_preview(img, max_size=600):
+    """Return a thumbnail copy for on-screen previews (2x the 300px display width)."""
+    preview = img.copy()
+    preview.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+    return preview
+
+def preview_bytes(img, quality=80):
+    """Encode a preview image as WebP so the browser gets a few KB instead of a full JPEG."""
+    buf = io.BytesIO()
+    img.save(buf, format='WEBP', quality=quality)
+    return buf.getvalue()
+
+def process_image_bytes(file_bytes, target_width, target_height, img_format, overlay_value=0):
+    """Orient, resize/crop, optionally overlay, and encode an uploaded image.
+
+    Pure function of its inputs (no session state) so it can run in a worker thread.
+    """
+    img = fix_exif_orientation(Image.open(io.BytesIO(file_bytes)))
+    resized_img = resize_and_crop(img, target_width, target_height)
+    if overlay_value > 0:
+        resized_img = apply_black_overlay(resized_img, overlay_value)
+    img_buffer = io.BytesIO()
+    if img_format == 'JPEG':
+        resized_img.save(img_buffer, format='JPEG', quality=100, subsampling=0)
+    else:
+        resized_img.save(img_buffer, format=img_format)
+    return img_buffer.getvalue()
+
+@functools.lru_cache(maxsize=512)
+def _word_count(text):
+    """Whitespace-delimited word count, memoized since copy text rarely changes between reruns."""
+    return len(text.split())
+
+@st.fragment
 def render_copy_section(restaurant_name, section_id, section_label, word_min, word_max, description, height=120):
-    """Render a copy section card with word count badge, text area, and copy button."""
+    """Render a copy section card with word count badge, text area, and copy button.
+
+    Runs as a fragment so editing one section only reruns that section.
+    """
     section_key = f"{restaurant_name}_copy_{section_id}"
-    if section_key not in st.session_state:
-        st.session_state[section_key] = ""
+    st.session_state.setdefault(section_key, "")
 
     text = st.session_state[section_key]
-    word_count = len(text.split()) if text.strip() else 0
+    word_count = _word_count(text)
     if word_count == 0:
         badge_class = "empty"
     elif word_min <= word_count <= word_max:
@@ -132,8 +194,7 @@ def render_copy_section(restaurant_name, section_id, section_label, word_min, wo
     # Initialize widget key from canonical on first render only;
     # code-driven updates (e.g. generation) push to widget key explicitly.
     widget_key = f"_w_{section_key}"
-    if widget_key not in st.session_state:
-        st.session_state[widget_key] = text
+    st.session_state.setdefault(widget_key, text)
     new_text = st.text_area(
         f"Edit {section_label}",
         value=text,
@@ -179,6 +240,20 @@ def copy_button(text, key):
     >Copy</button>
     """, height=50)
 
+def _select_restaurant(rest_name):
+    """on_click callback: make rest_name the active restaurant."""
+    st.session_state['restaurant_name_cleaned'] = rest_name
+
+def _delete_restaurant(rest_name):
+    """on_click callback: remove rest_name from the DB and the session list."""
+    db.delete_restaurant(rest_name)
+    st.session_state['restaurants_list'].remove(rest_name)
+    if st.session_state.get('restaurant_name_cleaned') == rest_name:
+        st.session_state['restaurant_name_cleaned'] = (
+            st.session_state['restaurants_list'][0]
+            if st.session_state['restaurants_list'] else None
+        )
+
 # ============================================================================
 # HUGGING FACE ALT TEXT GENERATION (Free Inference API)
 # ============================================================================
@@ -188,12 +263,15 @@ def _get_hf_client(token):
     """Return a cached InferenceClient instance for the given token."""
     return InferenceClient(token=token)
 
-@st.cache_data(show_spinner=False)
-def _load_persisted_image(restaurant, field_name):
-    """Load image blob and metadata from DB (cached to avoid re-fetching every rerun)."""
-    blob_data = db.get_image_data(restaurant, field_name)
-    record = db.get_image_record(restaurant, field_name)
-    return blob_data, record
+@st.cache_resource(show_spinner=False)
+def _load_persisted_images(restaurant):
+    """Load every image blob + metadata for a restaurant in one query (cached across reruns).
+
+    cache_resource hands back the same dict on every call (cache_data would
+    unpickle a copy of every blob per lookup), so treat it as read-only;
+    writers call _load_persisted_images.clear().
+    """
+    return db.get_all_images(restaurant)
 
 def generate_alt_text(pil_image):
     """Generate alt text from image using Hugging Face Inference API (Qwen Vision)."""
@@ -201,7 +279,10 @@ def generate_alt_text(pil_image):
     if not api_token:
         return None
 
-    # Convert PIL image to base64 (convert to RGB for JPEG compatibility)
+    # Downscale (the model doesn't need full resolution), then convert to
+    # base64 (convert to RGB for JPEG compatibility)
+    pil_image = pil_image.copy()
+    pil_image.thumbnail((512, 512), Image.Resampling.BILINEAR, reducing_gap=3.0)
     img_buffer = io.BytesIO()
     if pil_image.mode in ('RGBA', 'LA', 'PA', 'P'):
         pil_image = pil_image.convert('RGB')
@@ -635,7 +716,7 @@ def _search_resy_url(restaurant_display_name):
         return ""
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@st.cache_data(ttl=3600, show_spinner=False)
 def scrape_website(url):
     """Scrape text content from a restaurant website and key subpages.
 
@@ -769,6 +850,7 @@ Guidelines:
 
 MASTER_INSTRUCTIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'master_copy_instructions.json')
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def load_master_instructions():
     """Load master copy instructions from disk, falling back to the hardcoded default."""
     try:
@@ -1127,7 +1209,7 @@ hr {
 
 
 /* === RESTAURANT LIST BUTTONS (lighter/subtler, half-width, left-aligned) === */
-button.rest-btn-light {
+[data-testid="stHorizontalBlock"]:has(.restaurant-row) [data-testid="stButton"] > button {
     border-color: #A0B4C8 !important;
     color: #A0B4C8 !important;
     font-weight: 400 !important;
@@ -1135,12 +1217,12 @@ button.rest-btn-light {
     width: auto !important;
     min-width: 0 !important;
 }
-button.rest-btn-light:hover {
+[data-testid="stHorizontalBlock"]:has(.restaurant-row) [data-testid="stButton"] > button:hover {
     background-color: #A0B4C8 !important;
     color: #FFFFFF !important;
 }
 @media (max-width: 640px) {
-    button.rest-btn-light {
+    [data-testid="stHorizontalBlock"]:has(.restaurant-row) [data-testid="stButton"] > button {
         margin-top: 0.25rem !important;
     }
 }
@@ -1361,21 +1443,22 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Initialize session state keys
-if 'hf_api_token' not in st.session_state:
-    st.session_state['hf_api_token'] = os.getenv('HF_API_TOKEN', '')
+st.session_state.setdefault('hf_api_token', os.getenv('HF_API_TOKEN', ''))
 
 # Load persisted data from SQLite on first run of this session
 if 'db_loaded' not in st.session_state:
     st.session_state['db_loaded'] = True
     with st.spinner("Loading restaurant data..."):
-        saved_restaurants = db.get_all_restaurants()
-        st.session_state['restaurants_list'] = [r['name'] for r in saved_restaurants]
+        # Restaurants, image metadata and copy in three queries total
+        bundle = db.get_dashboard_bundle()
+        st.session_state['restaurants_list'] = list(bundle)
 
         # Restore URLs, copy, alt text, and overlay settings per restaurant
-        for r in saved_restaurants:
-            rname = r['name']
+        for rname, entry in bundle.items():
+            r = entry['restaurant']
             if r['website_url']:
                 st.session_state[f"{rname}_website_url"] = r['website_url']
+            st.session_state[f"{rname}_website_url_persisted_val"] = r['website_url'] or ""
             if r.get('notes'):
                 st.session_state[f"{rname}_notes"] = r['notes']
             if r.get('primary_color'):
@@ -1405,18 +1488,21 @@ if 'db_loaded' not in st.session_state:
                 except Exception:
                     pass
 
-            # Restore copy sections
-            copy_data = db.get_copy_for_restaurant(rname)
+            # Restore copy sections (remember the persisted value so Save can skip no-op writes)
+            copy_data = entry['copy']
             for sec_id, content in copy_data.items():
                 st.session_state[f"{rname}_copy_{sec_id}"] = content
+                st.session_state[f"{rname}_copy_{sec_id}_persisted_val"] = content
 
             # Restore image metadata (alt text, overlay)
-            img_data = db.get_images_for_restaurant(rname)
+            img_data = entry['images']
             for field_name, info in img_data.items():
                 if info['alt_text']:
                     st.session_state[f"{rname}_{field_name}_alt"] = info['alt_text']
+                st.session_state[f"{rname}_{field_name}_alt_prev"] = info['alt_text']
                 if field_name in ('Hero_Image_Desktop', 'Hero_Image_Mobile'):
                     st.session_state[f"{rname}_{field_name}_opacity"] = info['overlay_opacity']
+                    st.session_state[f"{rname}_{field_name}_overlay_saved"] = info['overlay_opacity']
                 # Mark that a persisted image exists in the database
                 if info.get('has_image'):
                     st.session_state[f"{rname}_{field_name}_persisted"] = True
@@ -1427,10 +1513,37 @@ if 'db_loaded' not in st.session_state:
         else:
             st.session_state.setdefault('restaurant_name_cleaned', None)
 
-if 'restaurants_list' not in st.session_state:
-    st.session_state['restaurants_list'] = []
-if 'restaurant_name_cleaned' not in st.session_state:
-    st.session_state['restaurant_name_cleaned'] = None
+st.session_state.setdefault('restaurants_list', [])
+st.session_state.setdefault('restaurant_name_cleaned', None)
+
+# Largest accepted image upload (mirrors server.maxUploadSize in .streamlit/config.toml)
+MAX_UPLOAD_MB = 15
+
+
+def _upload_too_large(uploaded_file):
+    """True for an uploader value that the image fields reject as oversized."""
+    return getattr(uploaded_file, 'size', 0) > MAX_UPLOAD_MB * 1024 * 1024
+
+
+# scrape_website() result key -> restaurants column (session key suffix)
+_DETECTED_FIELD_COLUMNS = [
+    ('primary_color', 'primary_color'),
+    ('booking', 'booking_platform'),
+    ('opentable_rid', 'opentable_rid'),
+    ('tripleseat_form_id', 'tripleseat_form_id'),
+    ('resy_url', 'resy_url'),
+    ('mailing_list_url', 'mailing_list_url'),
+    ('facebook_url', 'facebook_url'),
+    ('instagram_url', 'instagram_url'),
+    ('phone', 'phone'),
+    ('email_general', 'email_general'),
+    ('email_events', 'email_events'),
+    ('email_marketing', 'email_marketing'),
+    ('email_press', 'email_press'),
+    ('address', 'address'),
+    ('google_maps_url', 'google_maps_url'),
+    ('order_online_url', 'order_online_url'),
+]
 
 # Image mappings: (name) -> (target_width, target_height)
 image_mappings = {
@@ -1463,6 +1576,51 @@ fields = [
     ('Chef_3', "Third Chef Image (Vertical + Black&White)", "Target: 600x800px — Vertical image, 3:4 aspect ratio.")
 ]
 
+_CHEF_FIELDS = {'Chef_1', 'Chef_2', 'Chef_3'}
+
+# Matches the per-restaurant session keys that feed the progress pills:
+#   {restaurant}_{field}            uploader
+#   {restaurant}_{field}_persisted  image saved in DB
+#   {restaurant}_{field}_alt        alt text
+#   {restaurant}_copy_{section_id}  copy section
+_PROGRESS_KEY_RE = re.compile(
+    r'^(?P<rest>.+)_(?:(?P<field>' + '|'.join(re.escape(f[0]) for f in fields) + r')(?P<kind>_persisted|_alt)?'
+    r'|copy_(?P<sid>' + '|'.join(re.escape(s[0]) for s in COPY_SECTIONS) + r'))$'
+)
+
+
+def aggregate_progress(state, rest_names):
+    """Single pass over session state -> {restaurant: (images, chef, alt, copy)} counts."""
+    rest_set = set(rest_names)
+    has_image = {r: set() for r in rest_names}
+    alt_counts = dict.fromkeys(rest_names, 0)
+    copy_counts = dict.fromkeys(rest_names, 0)
+    for key, val in state.items():
+        m = _PROGRESS_KEY_RE.match(key) if isinstance(key, str) else None
+        if not m or m.group('rest') not in rest_set:
+            continue
+        rest = m.group('rest')
+        if m.group('sid'):
+            if isinstance(val, str) and val.strip():
+                copy_counts[rest] += 1
+        elif m.group('kind') == '_alt':
+            if isinstance(val, str) and val.strip():
+                alt_counts[rest] += 1
+        elif m.group('kind') == '_persisted':
+            if val:
+                has_image[rest].add(m.group('field'))
+        elif val is not None and not _upload_too_large(val):
+            has_image[rest].add(m.group('field'))
+    return {
+        r: (
+            len(has_image[r] - _CHEF_FIELDS),
+            len(has_image[r] & _CHEF_FIELDS),
+            alt_counts[r],
+            copy_counts[r],
+        )
+        for r in rest_names
+    }
+
 # ============================================================================
 # MAIN UI - TABBED LAYOUT
 # ============================================================================
@@ -1492,74 +1650,47 @@ with tab_restaurants:
                 url_val = restaurant_url_input.strip()
                 if url_val:
                     st.session_state[f"{cleaned_name}_website_url"] = url_val
-                # Persist to database
-                db.add_restaurant(cleaned_name, restaurant_input.strip(), url_val)
-                # Auto-detect primary color if URL provided
-                if url_val:
-                    try:
-                        ok, _, _, d = scrape_website(url_val)
-                        if ok and d.get('primary_color'):
-                            st.session_state[f"{cleaned_name}_primary_color"] = d['primary_color']
-                            db.update_restaurant_color(cleaned_name, d['primary_color'])
-                        if ok and d.get('booking'):
-                            st.session_state[f"{cleaned_name}_booking_platform"] = d['booking']
-                            db.update_restaurant_booking(cleaned_name, d['booking'])
-                        # If OpenTable but no RID from HTML, search OpenTable.com
-                        if ok and d.get('booking') == "OpenTable" and not d.get('opentable_rid'):
-                            d['opentable_rid'] = _search_opentable_rid(restaurant_input.strip())
-                        if ok and d.get('opentable_rid'):
-                            st.session_state[f"{cleaned_name}_opentable_rid"] = d['opentable_rid']
-                            db.update_restaurant_opentable_rid(cleaned_name, d['opentable_rid'])
-                        if ok and d.get('tripleseat_form_id'):
-                            st.session_state[f"{cleaned_name}_tripleseat_form_id"] = d['tripleseat_form_id']
-                            db.update_restaurant_tripleseat(cleaned_name, d['tripleseat_form_id'])
-                        # If no Resy URL from HTML, search Google
-                        if ok and not d.get('resy_url'):
-                            d['resy_url'] = _search_resy_url(restaurant_input.strip())
-                        if ok and d.get('resy_url'):
-                            st.session_state[f"{cleaned_name}_resy_url"] = d['resy_url']
-                            db.update_restaurant_resy_url(cleaned_name, d['resy_url'])
-                        if ok and d.get('mailing_list_url'):
-                            st.session_state[f"{cleaned_name}_mailing_list_url"] = d['mailing_list_url']
-                            db.update_restaurant_mailing_list_url(cleaned_name, d['mailing_list_url'])
-                        # Store new metadata fields
-                        _new_fields = {
-                            'facebook_url': db.update_restaurant_facebook_url,
-                            'instagram_url': db.update_restaurant_instagram_url,
-                            'phone': db.update_restaurant_phone,
-                            'email_general': db.update_restaurant_email_general,
-                            'email_events': db.update_restaurant_email_events,
-                            'email_marketing': db.update_restaurant_email_marketing,
-                            'email_press': db.update_restaurant_email_press,
-                            'address': db.update_restaurant_address,
-                            'google_maps_url': db.update_restaurant_google_maps_url,
-                            'order_online_url': db.update_restaurant_order_online_url,
-                        }
-                        if ok:
-                            for fkey, db_fn in _new_fields.items():
-                                if d.get(fkey):
-                                    st.session_state[f"{cleaned_name}_{fkey}"] = d[fkey]
-                                    db_fn(cleaned_name, d[fkey])
-                        if ok and d.get('logo_url'):
-                            try:
-                                logo_resp = requests.get(d['logo_url'], headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
-                                if logo_resp.status_code == 200 and logo_resp.content:
-                                    fname = d['logo_url'].rsplit('/', 1)[-1].split('?')[0] or "logo.png"
-                                    db.save_image(cleaned_name, "Logo", logo_resp.content, fname, alt_text='')
-                                    st.session_state[f"{cleaned_name}_Logo_persisted"] = True
-                            except Exception:
-                                pass
-                        if ok and d.get('favicon_url'):
-                            try:
-                                fav_resp = requests.get(d['favicon_url'], headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
-                                if fav_resp.status_code == 200 and fav_resp.content:
-                                    fname = d['favicon_url'].rsplit('/', 1)[-1].split('?')[0] or "favicon.png"
-                                    db.save_image(cleaned_name, "Favicon", fav_resp.content, fname, alt_text='')
-                                    st.session_state[f"{cleaned_name}_Favicon_persisted"] = True
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
+                with db.batched_writes():  # one Turso sync for the add + auto-detected data
+                    # Persist to database
+                    db.add_restaurant(cleaned_name, restaurant_input.strip(), url_val)
+                    # Auto-detect primary color if URL provided
+                    if url_val:
+                        try:
+                            ok, _, _, d = scrape_website(url_val)
+                            if ok:
+                                # If OpenTable but no RID from HTML, search OpenTable.com
+                                if d.get('booking') == "OpenTable" and not d.get('opentable_rid'):
+                                    d['opentable_rid'] = _search_opentable_rid(restaurant_input.strip())
+                                # If no Resy URL from HTML, search Google
+                                if not d.get('resy_url'):
+                                    d['resy_url'] = _search_resy_url(restaurant_input.strip())
+                                # Store every detected field with a single UPDATE
+                                detected = {}
+                                for dkey, col in _DETECTED_FIELD_COLUMNS:
+                                    if d.get(dkey):
+                                        st.session_state[f"{cleaned_name}_{col}"] = d[dkey]
+                                        detected[col] = d[dkey]
+                                db.update_restaurant(cleaned_name, **detected)
+                            if ok and d.get('logo_url'):
+                                try:
+                                    logo_resp = requests.get(d['logo_url'], headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
+                                    if logo_resp.status_code == 200 and logo_resp.content:
+                                        fname = d['logo_url'].rsplit('/', 1)[-1].split('?')[0] or "logo.png"
+                                        db.save_image(cleaned_name, "Logo", logo_resp.content, fname, alt_text='').result()
+                                        st.session_state[f"{cleaned_name}_Logo_persisted"] = True
+                                except Exception:
+                                    pass
+                            if ok and d.get('favicon_url'):
+                                try:
+                                    fav_resp = requests.get(d['favicon_url'], headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
+                                    if fav_resp.status_code == 200 and fav_resp.content:
+                                        fname = d['favicon_url'].rsplit('/', 1)[-1].split('?')[0] or "favicon.png"
+                                        db.save_image(cleaned_name, "Favicon", fav_resp.content, fname, alt_text='').result()
+                                        st.session_state[f"{cleaned_name}_Favicon_persisted"] = True
+                                except Exception:
+                                    pass
+                        except Exception:
+                            pass
                 st.success(f"Restaurant '{restaurant_input}' added as: {cleaned_name}")
                 st.rerun()
 
@@ -1581,36 +1712,12 @@ with tab_restaurants:
             rest_list = [r for r in all_rest if r in selected_set]
         else:
             rest_list = all_rest
+        # Image / chef / alt / copy counts for every listed restaurant in one pass
+        progress = aggregate_progress(st.session_state, rest_list)
         for rest_idx, rest_name in enumerate(rest_list):
             col1, col2, col3, col4 = st.columns([3, 1, 2, 1.5], vertical_alignment="center")
             with col1:
-                # Count uploaded images (required vs optional chef)
-                image_count = 0
-                chef_count = 0
-                _CHEF_FIELDS = {'Chef_1', 'Chef_2', 'Chef_3'}
-                for field_name, _, _ in fields:
-                    uploader_key = f"{rest_name}_{field_name}"
-                    persisted_key = f"{rest_name}_{field_name}_persisted"
-                    has_upload = st.session_state.get(uploader_key) is not None
-                    has_persisted = st.session_state.get(persisted_key, False)
-                    if has_upload or has_persisted:
-                        if field_name in _CHEF_FIELDS:
-                            chef_count += 1
-                        else:
-                            image_count += 1
-
-                # Count completed alt texts
-                alt_count = 0
-                for field_name, _, _ in fields:
-                    alt_key = f"{rest_name}_{field_name}_alt"
-                    if alt_key in st.session_state and st.session_state[alt_key].strip():
-                        alt_count += 1
-
-                # Count completed copy sections
-                copy_count = 0
-                for sid, _, _, _, _ in COPY_SECTIONS:
-                    if st.session_state.get(f"{rest_name}_copy_{sid}", "").strip():
-                        copy_count += 1
+                image_count, chef_count, alt_count, copy_count = progress[rest_name]
 
                 is_active = rest_name == st.session_state.get('restaurant_name_cleaned')
                 active_class = " active" if is_active else ""
@@ -1652,18 +1759,8 @@ with tab_restaurants:
                 )
 
             with col2:
-                if st.button("Select", key=f"select_{rest_name}"):
-                    st.session_state['restaurant_name_cleaned'] = rest_name
-                    st.rerun()
-                if st.button("Delete", key=f"delete_{rest_name}"):
-                    db.delete_restaurant(rest_name)
-                    st.session_state['restaurants_list'].remove(rest_name)
-                    if st.session_state.get('restaurant_name_cleaned') == rest_name:
-                        st.session_state['restaurant_name_cleaned'] = (
-                            st.session_state['restaurants_list'][0]
-                            if st.session_state['restaurants_list'] else None
-                        )
-                    st.rerun()
+                st.button("Select", key=f"select_{rest_name}", on_click=_select_restaurant, args=(rest_name,))
+                st.button("Delete", key=f"delete_{rest_name}", on_click=_delete_restaurant, args=(rest_name,))
 
             with col3:
                 notes_key = f"{rest_name}_notes"
@@ -1671,8 +1768,7 @@ with tab_restaurants:
                 st.session_state.setdefault(notes_key, "")
                 st.session_state.setdefault(saved_notes_key, st.session_state[notes_key])
                 notes_wk = f"_w_{notes_key}"
-                if notes_wk not in st.session_state:
-                    st.session_state[notes_wk] = st.session_state[notes_key]
+                st.session_state.setdefault(notes_wk, st.session_state[notes_key])
                 notes_val = st.text_area(
                     "Notes",
                     value=st.session_state[notes_key],
@@ -1693,8 +1789,7 @@ with tab_restaurants:
                 pd_prev_key = f"{rest_name}_prev_pull_data"
                 st.session_state.setdefault(pd_prev_key, st.session_state[pd_key])
                 pd_wk = f"_w_{pd_key}"
-                if pd_wk not in st.session_state:
-                    st.session_state[pd_wk] = st.session_state[pd_key]
+                st.session_state.setdefault(pd_wk, st.session_state[pd_key])
                 st.checkbox("Push Data", value=st.session_state[pd_key], key=pd_wk)
                 st.session_state[pd_key] = bool(st.session_state.get(pd_wk, False))
                 pd_val = bool(st.session_state[pd_key])
@@ -1711,8 +1806,7 @@ with tab_restaurants:
                     ckey = f"{rest_name}_check_{ck}"
                     st.session_state.setdefault(ckey, False)
                     ck_wk = f"_w_{ckey}"
-                    if ck_wk not in st.session_state:
-                        st.session_state[ck_wk] = st.session_state[ckey]
+                    st.session_state.setdefault(ck_wk, st.session_state[ckey])
                     st.checkbox(cl, value=st.session_state[ckey], key=ck_wk)
                     st.session_state[ckey] = bool(st.session_state.get(ck_wk, False))
                 cl_dict = {ck: bool(st.session_state.get(f"{rest_name}_check_{ck}", False))
@@ -1727,17 +1821,11 @@ with tab_restaurants:
             if rest_idx < len(rest_list) - 1:
                 st.markdown('<hr class="restaurant-separator">', unsafe_allow_html=True)
 
-        # Lighten Select/Delete buttons + wire up color pill click-to-copy
+        # Wire up color pill click-to-copy
         components.html("""
         <script>
         setTimeout(() => {
             const doc = window.parent.document;
-            doc.querySelectorAll('button').forEach((btn) => {
-                const txt = btn.textContent.trim();
-                if (txt === 'Select' || txt === 'Delete') {
-                    btn.classList.add('rest-btn-light');
-                }
-            });
             doc.querySelectorAll('.progress-pill.color[data-color]').forEach((pill) => {
                 pill.addEventListener('click', (e) => {
                     e.stopPropagation();
@@ -1798,6 +1886,242 @@ with tab_images:
         _CHEF_FIELDS_SET = {'Chef_1', 'Chef_2', 'Chef_3'}
         _chef_expander = None
 
+        @st.fragment
+        def _render_image_field(restaurant_name, name, header, uploaded_file):
+            """Preview, overlay slider, download and alt text for one field.
+
+            Runs as a fragment so slider / alt-text edits rerun only this field.
+            """
+            keys = field_keys(restaurant_name, name)
+
+            # Determine image source: fresh upload or persisted in database
+            persisted_flag_key = keys.persisted
+            has_persisted = bool(st.session_state.get(persisted_flag_key, False))
+
+            resized_img = None
+            persisted_blob = None
+            img_format = 'JPEG'
+            ext = 'jpg'
+            target_width, target_height = image_mappings[name]
+            target_ratio = target_width / target_height
+            alt_for_filename = st.session_state.get(keys.alt, "")
+            new_filename = make_image_filename(restaurant_name, name, target_width, target_height, 'jpg', alt_for_filename)
+            is_fresh_upload = False
+            _orig_filename = ''
+
+            if uploaded_file:
+                is_fresh_upload = True
+                _orig_filename = uploaded_file.name
+                # Track file fingerprint to only save once per unique upload
+                _upload_fp = f"{uploaded_file.name}_{uploaded_file.size}"
+                _saved_fp_key = keys.saved_fp
+                if _upload_fp != st.session_state.get(_saved_fp_key):
+                    st.session_state[_saved_fp_key] = _upload_fp
+                img = fix_exif_orientation(Image.open(uploaded_file))
+
+                width, height = img.size
+                original_ratio = width / height
+
+                allowed_deviation = target_ratio * 0.3
+                aspect_ok = abs(original_ratio - target_ratio) <= allowed_deviation
+
+                is_chef = name in ['Chef_1', 'Chef_2', 'Chef_3']
+                bw_ok = True
+                if is_chef:
+                    with st.spinner('Checking if image is grayscale...'):
+                        bw_ok = _is_bw_cached(uploaded_file.getvalue())
+
+                convert_key = keys.convert_bw
+                bw_converted_key = keys.bw_converted
+
+                # Clear converted flag when a new file is uploaded
+                file_fp = f"{uploaded_file.name}_{uploaded_file.size}"
+                fp_key = keys.bw_fp
+                if file_fp != st.session_state.get(fp_key):
+                    st.session_state[fp_key] = file_fp
+                    st.session_state.pop(bw_converted_key, None)
+
+                if is_chef and (st.session_state.get(convert_key) or st.session_state.get(bw_converted_key)):
+                    img = img.convert('L').convert('RGB')
+                    bw_ok = True
+                    st.session_state.pop(convert_key, None)
+                    st.session_state[bw_converted_key] = True
+
+                if not aspect_ok:
+                    st.warning("Oops Funky Ingredients: The aspect ratio deviates by more than 30% from the target. Processing may crop substantially.")
+                if is_chef and not bw_ok:
+                    warn_col, btn_col = st.columns([3, 1])
+                    with warn_col:
+                        st.warning("Brand guidelines suggest Black&White images of the chefs to keep with the editorial look.")
+                    with btn_col:
+                        if st.button("Convert to B&W", key=f"convert_bw_{name}"):
+                            st.session_state[keys.convert_bw] = True
+                            st.rerun()
+                if aspect_ok and (not is_chef or bw_ok):
+                    st.success("Perfect, looks delicious!")
+
+                resized_img = resize_and_crop(img, target_width, target_height)
+
+                ext = uploaded_file.name.split('.')[-1].lower()
+                format_map = {'jpg': 'JPEG', 'jpeg': 'JPEG', 'png': 'PNG'}
+                img_format = format_map.get(ext, 'JPEG')
+                new_filename = make_image_filename(restaurant_name, name, target_width, target_height, ext, alt_for_filename)
+
+            elif has_persisted:
+                # Load previously saved image from database blob (cached)
+                record = _load_persisted_images(restaurant_name).get(name)
+                blob_data = record['image_data'] if record else None
+                if blob_data:
+                    persisted_blob = blob_data
+                    resized_img = Image.open(io.BytesIO(blob_data))
+                    orig_fn = record.get('original_filename', '') if record else ''
+                    _orig_filename = orig_fn
+                    ext = orig_fn.rsplit('.', 1)[-1].lower() if '.' in orig_fn else 'jpg'
+                    format_map = {'jpg': 'JPEG', 'jpeg': 'JPEG', 'png': 'PNG'}
+                    img_format = format_map.get(ext, 'JPEG')
+                    alt_for_filename = st.session_state.get(keys.alt, "")
+                    new_filename = make_image_filename(restaurant_name, name, target_width, target_height, ext, alt_for_filename)
+                    st.caption("Previously saved image loaded from storage.")
+                    if st.button("Delete Image", key=f"delete_{name}"):
+                        db.delete_image(restaurant_name, name)
+                        st.session_state[persisted_flag_key] = False
+                        st.session_state.pop(keys.alt, None)
+                        st.session_state.pop(keys.auto_generated, None)
+                        st.session_state.pop(keys.alt_source, None)
+                        st.rerun()
+
+            if resized_img:
+                st.markdown('<div class="field-label">Preview</div>', unsafe_allow_html=True)
+
+                # Hero images: show overlay slider
+                if name in ['Hero_Image_Desktop', 'Hero_Image_Mobile']:
+                    opacity_key = keys.opacity
+                    st.session_state.setdefault(opacity_key, 40)
+
+                    st.markdown('<div class="field-label">Filter Opacity</div>', unsafe_allow_html=True)
+                    col1, col2 = st.columns([3, 1])
+                    with col1:
+                        st.session_state[opacity_key] = st.slider(
+                            "Opacity",
+                            min_value=0,
+                            max_value=100,
+                            value=st.session_state[opacity_key],
+                            step=5,
+                            key=f"slider_{name}",
+                            label_visibility="collapsed"
+                        )
+                    with col2:
+                        st.metric("Opacity", f"{st.session_state[opacity_key]}%")
+
+                    overlay_value = st.session_state[opacity_key]
+                    # Before/after previews are built from a small thumbnail
+                    preview_img = make_preview(resized_img)
+                    if overlay_value > 0:
+                        preview_with_overlay = apply_black_overlay(preview_img, overlay_value)
+                    else:
+                        preview_with_overlay = preview_img
+
+                    col_before, col_after = st.columns(2)
+                    with col_before:
+                        st.caption("Without Filter")
+                        st.image(preview_bytes(preview_img), width=300)
+                    with col_after:
+                        st.caption(f"With Filter ({overlay_value}% opacity)")
+                        st.image(preview_bytes(preview_with_overlay), width=300)
+
+                    if overlay_value > 0:
+                        resized_img = apply_black_overlay(resized_img, overlay_value)
+
+                else:
+                    st.image(preview_bytes(make_preview(resized_img)), width=300)
+
+                # Persisted images are stored already processed — serve the blob
+                # as-is unless a hero overlay has changed since it was saved
+                is_hero = name in ['Hero_Image_Desktop', 'Hero_Image_Mobile']
+                if persisted_blob is not None and (
+                    not is_hero or st.session_state.get(keys.overlay_saved) == st.session_state.get(keys.opacity)
+                ):
+                    img_bytes = persisted_blob
+                else:
+                    img_buffer = io.BytesIO()
+                    if img_format == 'JPEG':
+                        resized_img.save(img_buffer, format='JPEG', quality=100, subsampling=0)
+                    else:
+                        resized_img.save(img_buffer, format=img_format)
+                    img_bytes = img_buffer.getvalue()
+
+                # Collect for batch save
+                _pending_saves[name] = {
+                    'img_bytes': img_bytes,
+                    'filename': _orig_filename,
+                    'is_fresh': is_fresh_upload,
+                }
+
+                # Download button for individual image
+                st.download_button(
+                    label=f"Download Resized {name}",
+                    data=img_bytes,
+                    file_name=new_filename,
+                    mime=f"image/{ext}",
+                    key=f"download_{name}"
+                )
+
+                # Alt text inline
+                alt_key = keys.alt
+                st.session_state.setdefault(alt_key, "")
+
+                # Auto-generate alt text when a new/different image is uploaded
+                auto_key = keys.auto_generated
+                alt_source_key = keys.alt_source
+                if is_fresh_upload and uploaded_file:
+                    file_fingerprint = f"{uploaded_file.name}_{uploaded_file.size}"
+                    if file_fingerprint != st.session_state.get(alt_source_key, ''):
+                        st.session_state[alt_source_key] = file_fingerprint
+                        st.session_state.pop(auto_key, None)
+
+                if is_fresh_upload and st.session_state.get('hf_api_token') and not st.session_state.get(auto_key):
+                    with st.spinner("Generating alt text..."):
+                        alt_text = generate_alt_text(resized_img)
+                    if alt_text:
+                        st.session_state[alt_key] = alt_text
+                        st.session_state[f"_w_{alt_key}"] = alt_text
+                        st.session_state[auto_key] = True
+
+                # Handle pending ADA regeneration (must set state BEFORE widget renders)
+                pending_alt_key = keys.pending_alt
+                if pending_alt_key in st.session_state:
+                    st.session_state[alt_key] = st.session_state.pop(pending_alt_key)
+                    st.session_state[f"_w_{alt_key}"] = st.session_state[alt_key]
+
+                st.markdown('<div class="field-label">Alt Text (ADA)</div>', unsafe_allow_html=True)
+                alt_text_val = st.session_state.get(alt_key, "")
+                alt_widget_key = f"_w_{alt_key}"
+                st.session_state.setdefault(alt_widget_key, alt_text_val)
+                new_alt = st.text_area(
+                    f"Alt text for {header}",
+                    value=alt_text_val,
+                    key=alt_widget_key,
+                    label_visibility="collapsed",
+                    height=68
+                )
+                st.session_state[alt_key] = new_alt
+
+                col_copy_alt, col_gen_alt, _col_spacer = st.columns([1, 1.5, 4], vertical_alignment="center")
+                with col_copy_alt:
+                    if st.session_state[alt_key].strip():
+                        copy_button(st.session_state[alt_key], f"copy_alt_{name}")
+                with col_gen_alt:
+                    regen_alt = st.button("Generate ADA Text", key=f"regen_alt_{name}", disabled=not st.session_state.get('hf_api_token'))
+                if regen_alt:
+                    with st.spinner("Generating alt text..."):
+                        alt_text = generate_alt_text(resized_img)
+                    if alt_text:
+                        st.session_state[pending_alt_key] = alt_text
+                        st.session_state[keys.auto_generated] = True
+                        st.rerun()
+                    else:
+                        st.warning("Alt text generation failed. Check your HF token or try again.")
+
         for i, (name, header, description) in enumerate(fields):
             # Open chef expander when we reach chef fields
             if name == 'Chef_1':
@@ -1814,242 +2138,21 @@ with tab_images:
                 </div>
                 """, unsafe_allow_html=True)
 
-                uploader_key = f"{restaurant_name}_{name}"
+                keys = field_keys(restaurant_name, name)
+                uploader_key = keys.uploader
                 uploaded_file = st.file_uploader(
                     "Upload image",
                     type=['jpg', 'jpeg', 'png'],
                     key=uploader_key,
                     label_visibility="collapsed"
                 )
+                # Reject oversized files before PIL decodes them
+                if uploaded_file and _upload_too_large(uploaded_file):
+                    st.error(f"File is larger than {MAX_UPLOAD_MB} MB. Please upload a smaller image.")
+                    uploaded_file = None
                 uploaded_files[name] = uploaded_file
 
-                # Determine image source: fresh upload or persisted in database
-                persisted_flag_key = f"{restaurant_name}_{name}_persisted"
-                has_persisted = bool(st.session_state.get(persisted_flag_key, False))
-
-                resized_img = None
-                img_format = 'JPEG'
-                ext = 'jpg'
-                target_width, target_height = image_mappings[name]
-                target_ratio = target_width / target_height
-                alt_for_filename = st.session_state.get(f"{restaurant_name}_{name}_alt", "")
-                new_filename = make_image_filename(restaurant_name, name, target_width, target_height, 'jpg', alt_for_filename)
-                is_fresh_upload = False
-                needs_save = False
-                _orig_filename = ''
-
-                if uploaded_file:
-                    is_fresh_upload = True
-                    _orig_filename = uploaded_file.name
-                    # Track file fingerprint to only save once per unique upload
-                    _upload_fp = f"{uploaded_file.name}_{uploaded_file.size}"
-                    _saved_fp_key = f"{restaurant_name}_{name}_saved_fp"
-                    if _upload_fp != st.session_state.get(_saved_fp_key):
-                        needs_save = True
-                        st.session_state[_saved_fp_key] = _upload_fp
-                    img = fix_exif_orientation(Image.open(uploaded_file))
-
-                    width, height = img.size
-                    original_ratio = width / height
-
-                    allowed_deviation = target_ratio * 0.3
-                    aspect_ok = abs(original_ratio - target_ratio) <= allowed_deviation
-
-                    is_chef = name in ['Chef_1', 'Chef_2', 'Chef_3']
-                    bw_ok = True
-                    if is_chef:
-                        with st.spinner('Checking if image is grayscale...'):
-                            bw_ok = is_black_and_white(img)
-
-                    convert_key = f"{restaurant_name}_{name}_convert_bw"
-                    bw_converted_key = f"{restaurant_name}_{name}_bw_converted"
-
-                    # Clear converted flag when a new file is uploaded
-                    file_fp = f"{uploaded_file.name}_{uploaded_file.size}"
-                    fp_key = f"{restaurant_name}_{name}_bw_fp"
-                    if file_fp != st.session_state.get(fp_key):
-                        st.session_state[fp_key] = file_fp
-                        st.session_state.pop(bw_converted_key, None)
-
-                    if is_chef and st.session_state.get(convert_key):
-                        needs_save = True  # Save the grayscale version
-                    if is_chef and (st.session_state.get(convert_key) or st.session_state.get(bw_converted_key)):
-                        img = img.convert('L').convert('RGB')
-                        bw_ok = True
-                        st.session_state.pop(convert_key, None)
-                        st.session_state[bw_converted_key] = True
-
-                    if not aspect_ok:
-                        st.warning("Oops Funky Ingredients: The aspect ratio deviates by more than 30% from the target. Processing may crop substantially.")
-                    if is_chef and not bw_ok:
-                        warn_col, btn_col = st.columns([3, 1])
-                        with warn_col:
-                            st.warning("Brand guidelines suggest Black&White images of the chefs to keep with the editorial look.")
-                        with btn_col:
-                            if st.button("Convert to B&W", key=f"convert_bw_{name}"):
-                                st.session_state[f"{restaurant_name}_{name}_convert_bw"] = True
-                                st.rerun()
-                    if aspect_ok and (not is_chef or bw_ok):
-                        st.success("Perfect, looks delicious!")
-
-                    resized_img = resize_and_crop(img, target_width, target_height)
-
-                    ext = uploaded_file.name.split('.')[-1].lower()
-                    format_map = {'jpg': 'JPEG', 'jpeg': 'JPEG', 'png': 'PNG'}
-                    img_format = format_map.get(ext, 'JPEG')
-                    new_filename = make_image_filename(restaurant_name, name, target_width, target_height, ext, alt_for_filename)
-
-                elif has_persisted:
-                    # Load previously saved image from database blob (cached)
-                    blob_data, record = _load_persisted_image(restaurant_name, name)
-                    if blob_data:
-                        resized_img = Image.open(io.BytesIO(blob_data))
-                        orig_fn = record.get('original_filename', '') if record else ''
-                        _orig_filename = orig_fn
-                        ext = orig_fn.rsplit('.', 1)[-1].lower() if '.' in orig_fn else 'jpg'
-                        format_map = {'jpg': 'JPEG', 'jpeg': 'JPEG', 'png': 'PNG'}
-                        img_format = format_map.get(ext, 'JPEG')
-                        alt_for_filename = st.session_state.get(f"{restaurant_name}_{name}_alt", "")
-                        new_filename = make_image_filename(restaurant_name, name, target_width, target_height, ext, alt_for_filename)
-                        st.caption("Previously saved image loaded from storage.")
-                        if st.button("Delete Image", key=f"delete_{name}"):
-                            db.delete_image(restaurant_name, name)
-                            st.session_state[persisted_flag_key] = False
-                            st.session_state.pop(f"{restaurant_name}_{name}_alt", None)
-                            st.session_state.pop(f"{restaurant_name}_{name}_auto_generated", None)
-                            st.session_state.pop(f"{restaurant_name}_{name}_alt_source", None)
-                            st.rerun()
-
-                if resized_img:
-                    st.markdown('<div class="field-label">Preview</div>', unsafe_allow_html=True)
-
-                    # Hero images: show overlay slider
-                    if name in ['Hero_Image_Desktop', 'Hero_Image_Mobile']:
-                        opacity_key = f"{restaurant_name}_{name}_opacity"
-                        if opacity_key not in st.session_state:
-                            st.session_state[opacity_key] = 40
-
-                        st.markdown('<div class="field-label">Filter Opacity</div>', unsafe_allow_html=True)
-                        col1, col2 = st.columns([3, 1])
-                        with col1:
-                            st.session_state[opacity_key] = st.slider(
-                                "Opacity",
-                                min_value=0,
-                                max_value=100,
-                                value=st.session_state[opacity_key],
-                                step=5,
-                                key=f"slider_{name}",
-                                label_visibility="collapsed"
-                            )
-                        with col2:
-                            st.metric("Opacity", f"{st.session_state[opacity_key]}%")
-
-                        overlay_value = st.session_state[opacity_key]
-                        resized_img_no_overlay = resized_img
-                        if overlay_value > 0:
-                            resized_img_with_overlay = apply_black_overlay(resized_img_no_overlay, overlay_value)
-                        else:
-                            resized_img_with_overlay = resized_img_no_overlay
-
-                        col_before, col_after = st.columns(2)
-                        with col_before:
-                            st.caption("Without Filter")
-                            st.image(resized_img_no_overlay, width=300)
-                        with col_after:
-                            st.caption(f"With Filter ({overlay_value}% opacity)")
-                            st.image(resized_img_with_overlay, width=300)
-
-                        final_opacity = st.session_state[opacity_key]
-                        if final_opacity > 0:
-                            resized_img = apply_black_overlay(resized_img_no_overlay, final_opacity)
-                        else:
-                            resized_img = resized_img_no_overlay
-
-                    else:
-                        st.image(resized_img, width=300)
-
-                    # Save processed image to disk on fresh upload
-                    img_buffer = io.BytesIO()
-                    if img_format == 'JPEG':
-                        resized_img.save(img_buffer, format='JPEG', quality=100, subsampling=0)
-                    else:
-                        resized_img.save(img_buffer, format=img_format)
-                    img_buffer.seek(0)
-                    img_bytes = img_buffer.getvalue()
-
-                    # Collect for batch save
-                    _pending_saves[name] = {
-                        'img_bytes': img_bytes,
-                        'filename': _orig_filename,
-                        'is_fresh': is_fresh_upload,
-                    }
-
-                    # Download button for individual image
-                    st.download_button(
-                        label=f"Download Resized {name}",
-                        data=img_bytes,
-                        file_name=new_filename,
-                        mime=f"image/{ext}",
-                        key=f"download_{name}"
-                    )
-
-                    # Alt text inline
-                    alt_key = f"{restaurant_name}_{name}_alt"
-                    if alt_key not in st.session_state:
-                        st.session_state[alt_key] = ""
-
-                    # Auto-generate alt text when a new/different image is uploaded
-                    auto_key = f"{restaurant_name}_{name}_auto_generated"
-                    alt_source_key = f"{restaurant_name}_{name}_alt_source"
-                    if is_fresh_upload and uploaded_file:
-                        file_fingerprint = f"{uploaded_file.name}_{uploaded_file.size}"
-                        if file_fingerprint != st.session_state.get(alt_source_key, ''):
-                            st.session_state[alt_source_key] = file_fingerprint
-                            st.session_state.pop(auto_key, None)
-
-                    if is_fresh_upload and st.session_state.get('hf_api_token') and not st.session_state.get(auto_key):
-                        with st.spinner("Generating alt text..."):
-                            alt_text = generate_alt_text(resized_img)
-                        if alt_text:
-                            st.session_state[alt_key] = alt_text
-                            st.session_state[f"_w_{alt_key}"] = alt_text
-                            st.session_state[auto_key] = True
-
-                    # Handle pending ADA regeneration (must set state BEFORE widget renders)
-                    pending_alt_key = f"{restaurant_name}_{name}_pending_alt"
-                    if pending_alt_key in st.session_state:
-                        st.session_state[alt_key] = st.session_state.pop(pending_alt_key)
-                        st.session_state[f"_w_{alt_key}"] = st.session_state[alt_key]
-
-                    st.markdown('<div class="field-label">Alt Text (ADA)</div>', unsafe_allow_html=True)
-                    alt_text_val = st.session_state.get(alt_key, "")
-                    alt_widget_key = f"_w_{alt_key}"
-                    if alt_widget_key not in st.session_state:
-                        st.session_state[alt_widget_key] = alt_text_val
-                    new_alt = st.text_area(
-                        f"Alt text for {header}",
-                        value=alt_text_val,
-                        key=alt_widget_key,
-                        label_visibility="collapsed",
-                        height=68
-                    )
-                    st.session_state[alt_key] = new_alt
-
-                    col_copy_alt, col_gen_alt, _col_spacer = st.columns([1, 1.5, 4], vertical_alignment="center")
-                    with col_copy_alt:
-                        if st.session_state[alt_key].strip():
-                            copy_button(st.session_state[alt_key], f"copy_alt_{name}")
-                    with col_gen_alt:
-                        regen_alt = st.button("Generate ADA Text", key=f"regen_alt_{name}", disabled=not st.session_state.get('hf_api_token'))
-                    if regen_alt:
-                        with st.spinner("Generating alt text..."):
-                            alt_text = generate_alt_text(resized_img)
-                        if alt_text:
-                            st.session_state[pending_alt_key] = alt_text
-                            st.session_state[f"{restaurant_name}_{name}_auto_generated"] = True
-                            st.rerun()
-                        else:
-                            st.warning("Alt text generation failed. Check your HF token or try again.")
+                _render_image_field(restaurant_name, name, header, uploaded_file)
 
                 # Dividers between fields (skip right before chef expander)
                 if i < len(fields) - 1:
@@ -2062,27 +2165,51 @@ with tab_images:
         st.markdown("---")
         save_images_bottom = st.button("Save", key="save_images_bottom")
         if save_images_top or save_images_bottom:
+            fresh = {}  # field_name -> (alt_text, overlay), written together below
+            for field_name, data in _pending_saves.items():
+                keys = field_keys(restaurant_name, field_name)
+                overlay = st.session_state.get(keys.opacity, 40)
+                # A hero's overlay is baked into the stored blob, so an opacity
+                # change must rewrite the blob, not just the overlay column
+                overlay_changed = (field_name in ('Hero_Image_Desktop', 'Hero_Image_Mobile')
+                                   and overlay != st.session_state.get(keys.overlay_saved))
+                if data['is_fresh'] or overlay_changed:
+                    fresh[field_name] = (st.session_state.get(keys.alt, ''), overlay)
+            # One transaction for every new or re-rendered image, written in the
+            # background while the metadata-only updates below run
+            fresh_save = db.save_images(
+                (restaurant_name, field_name, _pending_saves[field_name]['img_bytes'],
+                 _pending_saves[field_name]['filename'], alt_text, overlay)
+                for field_name, (alt_text, overlay) in fresh.items()
+            )
             saved_count = 0
             for field_name, data in _pending_saves.items():
-                alt_text = st.session_state.get(f"{restaurant_name}_{field_name}_alt", '')
-                overlay = st.session_state.get(f"{restaurant_name}_{field_name}_opacity", 40)
-                if data['is_fresh']:
-                    db.save_image(
-                        restaurant_name, field_name, data['img_bytes'],
-                        data['filename'],
-                        alt_text=alt_text,
-                        overlay_opacity=overlay,
-                    )
-                    st.session_state[f"{restaurant_name}_{field_name}_persisted"] = True
-                else:
+                if field_name in fresh:
+                    continue
+                keys = field_keys(restaurant_name, field_name)
+                alt_text = st.session_state.get(keys.alt, '')
+                # Skip the write when the alt text hasn't changed since last save
+                # (an unchanged hero overlay needs no write either)
+                if alt_text != st.session_state.get(keys.alt_prev):
                     db.update_alt_text(restaurant_name, field_name, alt_text)
-                    if field_name in ('Hero_Image_Desktop', 'Hero_Image_Mobile'):
-                        db.update_overlay(restaurant_name, field_name, overlay)
+                    st.session_state[keys.alt_prev] = alt_text
                 saved_count += 1
-            _load_persisted_image.clear()
+            # Only mark the images persisted once their write has committed
+            try:
+                fresh_save.result()
+            except Exception as e:
+                st.error(f"Failed to save {len(fresh)} image(s): {e}")
+            else:
+                for field_name, (alt_text, overlay) in fresh.items():
+                    keys = field_keys(restaurant_name, field_name)
+                    st.session_state[keys.persisted] = True
+                    st.session_state[keys.alt_prev] = alt_text
+                    st.session_state[keys.overlay_saved] = overlay
+                saved_count += len(fresh)
+            _load_persisted_images.clear()
             if saved_count:
                 st.toast(f"Saved {saved_count} image(s) with alt text and settings.")
-            else:
+            elif not _pending_saves:
                 st.info("No images to save. Upload images first.")
 
         # Batch download
@@ -2090,36 +2217,35 @@ with tab_images:
             st.markdown("---")
             if st.button("Download All Resized Images"):
                 with st.spinner("Preparing ZIP file..."):
+                    # Gather inputs on the script thread (session_state isn't
+                    # available from worker threads), then resize/encode in parallel.
+                    jobs = []
+                    for name, file in uploaded_files.items():
+                        if file:
+                            keys = field_keys(restaurant_name, name)
+                            target_width, target_height = image_mappings[name]
+                            overlay_value = 0
+                            if name in ['Hero_Image_Desktop', 'Hero_Image_Mobile']:
+                                overlay_value = st.session_state.get(keys.opacity, 40)
+                            ext = file.name.split('.')[-1].lower()
+                            format_map = {'jpg': 'JPEG', 'jpeg': 'JPEG', 'png': 'PNG'}
+                            img_format = format_map.get(ext, 'JPEG')
+                            alt_for_filename = st.session_state.get(keys.alt, "")
+                            new_filename = make_image_filename(restaurant_name, name, target_width, target_height, ext, alt_for_filename)
+                            jobs.append((new_filename, file.getvalue(), target_width, target_height, img_format, overlay_value))
+
                     zip_buffer = io.BytesIO()
-                    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-                        for name, file in uploaded_files.items():
-                            if file:
-                                target_width, target_height = image_mappings[name]
-                                img = fix_exif_orientation(Image.open(file))
-
-                                resized_img = resize_and_crop(img, target_width, target_height)
-
-                                if name in ['Hero_Image_Desktop', 'Hero_Image_Mobile']:
-                                    opacity_key = f"{restaurant_name}_{name}_opacity"
-                                    overlay_value = st.session_state.get(opacity_key, 40)
-                                    if overlay_value > 0:
-                                        resized_img = apply_black_overlay(resized_img, overlay_value)
-
-                                ext = file.name.split('.')[-1].lower()
-                                format_map = {'jpg': 'JPEG', 'jpeg': 'JPEG', 'png': 'PNG'}
-                                img_format = format_map.get(ext, 'JPEG')
-                                alt_for_filename = st.session_state.get(f"{restaurant_name}_{name}_alt", "")
-                                new_filename = make_image_filename(restaurant_name, name, target_width, target_height, ext, alt_for_filename)
-
-                                img_buffer = io.BytesIO()
-                                if img_format == 'JPEG':
-                                    resized_img.save(img_buffer, format='JPEG', quality=100, subsampling=0)
-                                else:
-                                    resized_img.save(img_buffer, format=img_format)
-                                img_buffer.seek(0)
-                                zip_file.writestr(f"Resized/{new_filename}", img_buffer.read())
-                
-                zip_buffer.seek(0)
+                    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+                        futures = [
+                            (new_filename, pool.submit(process_image_bytes, file_bytes, tw, th, img_format, overlay_value))
+                            for new_filename, file_bytes, tw, th, img_format, overlay_value in jobs
+                        ]
+                        # zipfile isn't thread-safe — write entries serially. JPEG/PNG
+                        # are already compressed, so store rather than deflate.
+                        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_STORED) as zip_file:
+                            for new_filename, future in futures:
+                                zip_file.writestr(f"Resized/{new_filename}", future.result())
+
                 st.download_button(
                     label="Download ZIP of All Resized Images",
                     data=zip_buffer,
@@ -2149,7 +2275,7 @@ with tab_copy:
         stored_url = st.session_state.get(url_key, "")
 
         # --- URL + Generate ---
-        col_url_edit, col_gen = st.columns([5, 1.2], vertical_alignment="bottom")
+        col_url_edit, col_gen, col_rescrape = st.columns([5, 1.2, 1], vertical_alignment="bottom")
         with col_url_edit:
             new_url = st.text_input(
                 "Website URL",
@@ -2162,6 +2288,11 @@ with tab_copy:
                 stored_url = new_url
         with col_gen:
             generate_all = st.button("Generate Copy", type="primary", disabled=not stored_url)
+        with col_rescrape:
+            # Scrapes are cached per URL for an hour; force a fresh fetch on demand
+            if st.button("Re-scrape", disabled=not stored_url, help="Discard the cached website content so the next generation fetches the site again."):
+                scrape_website.clear()
+                st.toast("Cached website content cleared.")
 
         if not stored_url:
             st.info("Enter a website URL above to enable copy generation.")
@@ -2192,6 +2323,7 @@ with tab_copy:
             with col_save:
                 if st.button("Save As Master"):
                     save_master_instructions(st.session_state['copy_instructions'])
+                    load_master_instructions.clear()
                     st.success("Saved as new master instructions.")
                     st.rerun()
 
@@ -2206,54 +2338,30 @@ with tab_copy:
                 if not ok:
                     st.error(err)
                 else:
-                    # Auto-fill detected fields if not already set
-                    _autofill = [
-                        ('primary_color', f"{restaurant_name}_primary_color", db.update_restaurant_color),
-                        ('booking', f"{restaurant_name}_booking_platform", db.update_restaurant_booking),
-                        ('tripleseat_form_id', f"{restaurant_name}_tripleseat_form_id", db.update_restaurant_tripleseat),
-                        ('resy_url', f"{restaurant_name}_resy_url", db.update_restaurant_resy_url),
-                        ('mailing_list_url', f"{restaurant_name}_mailing_list_url", db.update_restaurant_mailing_list_url),
-                        ('facebook_url', f"{restaurant_name}_facebook_url", db.update_restaurant_facebook_url),
-                        ('instagram_url', f"{restaurant_name}_instagram_url", db.update_restaurant_instagram_url),
-                        ('phone', f"{restaurant_name}_phone", db.update_restaurant_phone),
-                        ('email_general', f"{restaurant_name}_email_general", db.update_restaurant_email_general),
-                        ('email_events', f"{restaurant_name}_email_events", db.update_restaurant_email_events),
-                        ('email_marketing', f"{restaurant_name}_email_marketing", db.update_restaurant_email_marketing),
-                        ('email_press', f"{restaurant_name}_email_press", db.update_restaurant_email_press),
-                        ('address', f"{restaurant_name}_address", db.update_restaurant_address),
-                        ('google_maps_url', f"{restaurant_name}_google_maps_url", db.update_restaurant_google_maps_url),
-                        ('order_online_url', f"{restaurant_name}_order_online_url", db.update_restaurant_order_online_url),
-                    ]
-                    for dkey, skey, db_fn in _autofill:
-                        if d.get(dkey) and not st.session_state.get(skey):
-                            st.session_state[skey] = d[dkey]
-                            db_fn(restaurant_name, d[dkey])
-                    # Auto-fill OpenTable RID if not already set
+                    # Look up OpenTable RID / Resy URL the HTML didn't expose
                     if d.get('booking') == "OpenTable" and not d.get('opentable_rid'):
                         d['opentable_rid'] = _search_opentable_rid(restaurant_name.replace('_', ' '))
-                    if d.get('opentable_rid'):
-                        r_key = f"{restaurant_name}_opentable_rid"
-                        if not st.session_state.get(r_key):
-                            st.session_state[r_key] = d['opentable_rid']
-                            db.update_restaurant_opentable_rid(restaurant_name, d['opentable_rid'])
-                    # Auto-fill Resy URL if not already set
                     if not d.get('resy_url'):
                         d['resy_url'] = _search_resy_url(restaurant_name.replace('_', ' '))
-                    if d.get('resy_url'):
-                        resy_key = f"{restaurant_name}_resy_url"
-                        if not st.session_state.get(resy_key):
-                            st.session_state[resy_key] = d['resy_url']
-                            db.update_restaurant_resy_url(restaurant_name, d['resy_url'])
+                    # Auto-fill detected fields that are not already set (one UPDATE)
+                    autofill = {}
+                    for dkey, col in _DETECTED_FIELD_COLUMNS:
+                        skey = f"{restaurant_name}_{col}"
+                        if d.get(dkey) and not st.session_state.get(skey):
+                            st.session_state[skey] = d[dkey]
+                            autofill[col] = d[dkey]
+                    db.update_restaurant(restaurant_name, **autofill)
                     with st.spinner("Generating marketing copy with AI - this may take 30-60 seconds..."):
                         ok, copy_dict, err = generate_copy(content, restaurant_name, instructions=st.session_state.get('copy_instructions'))
                     if not ok:
                         st.error(err)
                     else:
+                        # Persist all generated copy to database
+                        db.save_all_copy(restaurant_name, copy_dict)
                         for sec_key, sec_val in copy_dict.items():
                             st.session_state[f"{restaurant_name}_copy_{sec_key}"] = sec_val
                             st.session_state[f"_w_{restaurant_name}_copy_{sec_key}"] = sec_val
-                        # Persist all generated copy to database
-                        db.save_all_copy(restaurant_name, copy_dict)
+                            st.session_state[f"{restaurant_name}_copy_{sec_key}_persisted_val"] = sec_val
                         st.success("Copy generated!")
                         st.rerun()
 
@@ -2269,26 +2377,38 @@ with tab_copy:
             if section_id in copy_section_ids:
                 render_copy_section(restaurant_name, section_id, section_label, word_min, word_max, description)
 
-        # === SEO META TAGS ===
-        st.markdown("---")
-        st.subheader("SEO Meta Tags")
-        st.caption("These are the HTML meta title and description tags for search engine optimization.")
+        # === SEO META TAGS (collapsed — rarely edited alongside website copy) ===
+        with st.expander("SEO Meta Tags", expanded=False):
+            st.caption("These are the HTML meta title and description tags for search engine optimization.")
 
-        for section_id, section_label, word_min, word_max, description in COPY_SECTIONS:
-            if section_id in meta_section_ids:
-                height = 68 if section_id == 'meta_title' else 80
-                render_copy_section(restaurant_name, section_id, section_label, word_min, word_max, description, height=height)
+            for section_id, section_label, word_min, word_max, description in COPY_SECTIONS:
+                if section_id in meta_section_ids:
+                    height = 68 if section_id == 'meta_title' else 80
+                    render_copy_section(restaurant_name, section_id, section_label, word_min, word_max, description, height=height)
 
         # Save handler (bottom)
         st.markdown("---")
         save_copy_bottom = st.button("Save", key="save_copy_bottom")
         if save_copy_top or save_copy_bottom:
+            # Only write sections whose content differs from what was last persisted
             copy_dict = {}
             for sid, _, _, _, _ in COPY_SECTIONS:
                 skey = f"{restaurant_name}_copy_{sid}"
-                copy_dict[sid] = st.session_state.get(skey, "")
-            db.save_all_copy(restaurant_name, copy_dict)
-            db.update_restaurant_url(restaurant_name, st.session_state.get(url_key, ""))
+                val = st.session_state.get(skey, "")
+                if val != st.session_state.get(f"{skey}_persisted_val"):
+                    copy_dict[sid] = val
+            url_val = st.session_state.get(url_key, "")
+            url_changed = url_val != st.session_state.get(f"{url_key}_persisted_val")
+            with db.transaction():  # one commit (and Turso sync) for the whole save
+                if copy_dict:
+                    db.save_all_copy(restaurant_name, copy_dict)
+                if url_changed:
+                    db.update_restaurant_url(restaurant_name, url_val)
+            # Only mark values persisted once the commit has succeeded
+            for sid, val in copy_dict.items():
+                st.session_state[f"{restaurant_name}_copy_{sid}_persisted_val"] = val
+            if url_changed:
+                st.session_state[f"{url_key}_persisted_val"] = url_val
             st.toast("All copy and metadata saved.")
 
 # ==============================================================================
@@ -2360,7 +2480,7 @@ with tab_brand:
                     logo_resp = requests.get(d['logo_url'], headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
                     if logo_resp.status_code == 200 and logo_resp.content:
                         fname = d['logo_url'].rsplit('/', 1)[-1].split('?')[0] or "logo.png"
-                        db.save_image(restaurant_name, "Logo", logo_resp.content, fname, alt_text='')
+                        db.save_image(restaurant_name, "Logo", logo_resp.content, fname, alt_text='').result()
                         st.session_state[f"{restaurant_name}_Logo_persisted"] = True
                         logo_saved = True
                 except Exception:
@@ -2371,7 +2491,7 @@ with tab_brand:
                     fav_resp = requests.get(d['favicon_url'], headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
                     if fav_resp.status_code == 200 and fav_resp.content:
                         fname = d['favicon_url'].rsplit('/', 1)[-1].split('?')[0] or "favicon.png"
-                        db.save_image(restaurant_name, "Favicon", fav_resp.content, fname, alt_text='')
+                        db.save_image(restaurant_name, "Favicon", fav_resp.content, fname, alt_text='').result()
                         st.session_state[f"{restaurant_name}_Favicon_persisted"] = True
                         favicon_saved = True
                 except Exception:
@@ -2389,7 +2509,7 @@ with tab_brand:
             st.markdown("**Logo**")
             logo_persisted_key = f"{restaurant_name}_Logo_persisted"
             if not st.session_state.get(logo_persisted_key):
-                if db.get_image_data(restaurant_name, "Logo"):
+                if db.has_image(restaurant_name, "Logo"):
                     st.session_state[logo_persisted_key] = True
             has_logo = st.session_state.get(logo_persisted_key, False)
             if has_logo:
@@ -2409,7 +2529,7 @@ with tab_brand:
             with _logo_container:
                 logo_file = st.file_uploader("Upload file", type=["png", "jpg", "jpeg", "gif", "svg", "webp"], key=f"{restaurant_name}_upload_logo")
                 if logo_file:
-                    db.save_image(restaurant_name, "Logo", logo_file.read(), logo_file.name)
+                    db.save_image(restaurant_name, "Logo", logo_file.read(), logo_file.name).result()
                     st.session_state[logo_persisted_key] = True
                     st.rerun()
                 logo_url_input = st.text_input("Or paste URL", key=f"{restaurant_name}_logo_url", placeholder="https://...")
@@ -2418,7 +2538,7 @@ with tab_brand:
                         resp = requests.get(logo_url_input, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
                         if resp.status_code == 200 and resp.content:
                             fname = logo_url_input.rsplit("/", 1)[-1].split("?")[0] or "logo.png"
-                            db.save_image(restaurant_name, "Logo", resp.content, fname)
+                            db.save_image(restaurant_name, "Logo", resp.content, fname).result()
                             st.session_state[logo_persisted_key] = True
                             st.rerun()
                         else:
@@ -2430,7 +2550,7 @@ with tab_brand:
             st.markdown("**Site Icon**")
             fav_persisted_key = f"{restaurant_name}_Favicon_persisted"
             if not st.session_state.get(fav_persisted_key):
-                if db.get_image_data(restaurant_name, "Favicon"):
+                if db.has_image(restaurant_name, "Favicon"):
                     st.session_state[fav_persisted_key] = True
             has_favicon = st.session_state.get(fav_persisted_key, False)
             if has_favicon:
@@ -2450,7 +2570,7 @@ with tab_brand:
             with _fav_container:
                 fav_file = st.file_uploader("Upload file", type=["png", "jpg", "jpeg", "gif", "svg", "ico", "webp"], key=f"{restaurant_name}_upload_favicon")
                 if fav_file:
-                    db.save_image(restaurant_name, "Favicon", fav_file.read(), fav_file.name)
+                    db.save_image(restaurant_name, "Favicon", fav_file.read(), fav_file.name).result()
                     st.session_state[fav_persisted_key] = True
                     st.rerun()
                 fav_url_input = st.text_input("Or paste URL", key=f"{restaurant_name}_favicon_url", placeholder="https://...")
@@ -2459,7 +2579,7 @@ with tab_brand:
                         resp = requests.get(fav_url_input, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
                         if resp.status_code == 200 and resp.content:
                             fname = fav_url_input.rsplit("/", 1)[-1].split("?")[0] or "favicon.png"
-                            db.save_image(restaurant_name, "Favicon", resp.content, fname)
+                            db.save_image(restaurant_name, "Favicon", resp.content, fname).result()
                             st.session_state[fav_persisted_key] = True
                             st.rerun()
                         else:
@@ -2662,22 +2782,14 @@ with tab_brand:
         st.markdown("---")
         save_brand_bottom = st.button("Save", key="save_brand_bottom")
         if save_brand_top or save_brand_bottom:
-            db.update_restaurant_color(restaurant_name, st.session_state.get(f"{restaurant_name}_primary_color", ""))
-            db.update_restaurant_booking(restaurant_name, st.session_state.get(f"{restaurant_name}_booking_platform", ""))
-            db.update_restaurant_opentable_rid(restaurant_name, st.session_state.get(f"{restaurant_name}_opentable_rid", ""))
-            db.update_restaurant_resy_url(restaurant_name, st.session_state.get(f"{restaurant_name}_resy_url", ""))
-            db.update_restaurant_tripleseat(restaurant_name, st.session_state.get(f"{restaurant_name}_tripleseat_form_id", ""))
-            db.update_restaurant_mailing_list_url(restaurant_name, st.session_state.get(f"{restaurant_name}_mailing_list_url", ""))
-            db.update_restaurant_order_online_url(restaurant_name, st.session_state.get(f"{restaurant_name}_order_online_url", ""))
-            db.update_restaurant_facebook_url(restaurant_name, st.session_state.get(f"{restaurant_name}_facebook_url", ""))
-            db.update_restaurant_instagram_url(restaurant_name, st.session_state.get(f"{restaurant_name}_instagram_url", ""))
-            db.update_restaurant_phone(restaurant_name, st.session_state.get(f"{restaurant_name}_phone", ""))
-            db.update_restaurant_email_general(restaurant_name, st.session_state.get(f"{restaurant_name}_email_general", ""))
-            db.update_restaurant_email_events(restaurant_name, st.session_state.get(f"{restaurant_name}_email_events", ""))
-            db.update_restaurant_email_marketing(restaurant_name, st.session_state.get(f"{restaurant_name}_email_marketing", ""))
-            db.update_restaurant_email_press(restaurant_name, st.session_state.get(f"{restaurant_name}_email_press", ""))
-            db.update_restaurant_address(restaurant_name, st.session_state.get(f"{restaurant_name}_address", ""))
-            db.update_restaurant_google_maps_url(restaurant_name, st.session_state.get(f"{restaurant_name}_google_maps_url", ""))
+            db.update_restaurant(restaurant_name, **{
+                col: st.session_state.get(f"{restaurant_name}_{col}", "")
+                for col in ('primary_color', 'booking_platform', 'opentable_rid', 'resy_url',
+                            'tripleseat_form_id', 'mailing_list_url', 'order_online_url',
+                            'facebook_url', 'instagram_url', 'phone', 'email_general',
+                            'email_events', 'email_marketing', 'email_press', 'address',
+                            'google_maps_url')
+            })
             st.toast("Brand & reservation data saved.")
 
         if not stored_url:
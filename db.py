@@ -9,6 +9,7 @@ Images are stored as BLOBs in the database (no filesystem dependency).
 Set TURSO_DB_URL + TURSO_AUTH_TOKEN env vars to enable Turso mode.
 """
 
+import atexit
 import os
 
 # ---------------------------------------------------------------------------
@@ -24,18 +25,65 @@ if USE_TURSO:
 else:
     import sqlite3
 
+import pathlib
+import queue
 import threading
+import time
+from concurrent.futures import Future, wait as wait_futures
+from contextlib import contextmanager
+
+try:
+    import zstandard
+except ImportError:
+    # Optional: without it new images are stored uncompressed; reading one that
+    # was stored compressed raises a clear error (see _zstd_decompressor).
+    zstandard = None
 
 DB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
 DB_PATH = os.path.join(DB_DIR, 'starr_cms.db')
 
-# Thread-local connection cache (avoids opening/closing per call)
+# Thread-local connection cache (Turso only — see get_connection)
 _local = threading.local()
 
-
-def _rows_to_dicts(cursor):
-    """Convert cursor result rows to a list of dicts (works with both drivers)."""
-    cols = [d[0] for d in cursor.description]
+# Local SQLite: a small pool of query_only reader connections plus one
+# dedicated writer. SQLite serialises writes anyway, so a single locked
+# writer avoids SQLITE_BUSY churn; WAL lets the readers run alongside it.
+# Readers are pooled rather than thread-local because Streamlit runs each
+# rerun on a fresh thread.
+_READ_POOL_SIZE = 4
+_READ_POOL_WAIT = 30  # seconds to wait for a free reader (matches busy_timeout)
+_read_pool = queue.LifoQueue(maxsize=_READ_POOL_SIZE)
+_read_pool_opened = 0
+_pool_lock = threading.Lock()
+_writer_conn = None
+_writer_lock = threading.RLock()
+
+# Applied once per local connection. WAL lets readers run alongside the
+# writer, which makes synchronous=NORMAL safe (no fsync per commit).
+_LOCAL_PRAGMAS = (
+    # page_size only takes effect on a brand-new file, so it must precede
+    # journal_mode=WAL (which writes the header); a no-op on existing DBs.
+    "PRAGMA page_size=8192",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",       # 64 MB page cache
+    "PRAGMA busy_timeout=30000",      # wait up to 30s for a lock instead of SQLITE_BUSY
+    "PRAGMA mmap_size=268435456",     # 256 MB memory-mapped reads
+)
+
+
+def _rows_to_dicts(cursor, cols=None):
+    """Convert cursor result rows to a list of dicts (works with both drivers).
+
+    cols may pass a precomputed column-name tuple to skip reading cursor.description.
+    """
+    if not USE_TURSO:
+        # Local connections use sqlite3.Row, whose dict() conversion runs in C
+        return [dict(r) for r in cursor.fetchall()]
+    if cols is None:
+        cols = [d[0] for d in cursor.description]
     return [dict(zip(cols, row)) for row in cursor.fetchall()]
 
 
@@ -44,32 +92,145 @@ def _row_to_dict(cursor):
     row = cursor.fetchone()
     if row is None:
         return None
+    if not USE_TURSO:
+        return dict(row)
     cols = [d[0] for d in cursor.description]
     return dict(zip(cols, row))
 
 
+def _open_local(readonly=False):
+    """Open a local sqlite3 connection with the PRAGMAs applied.
+
+    Reader connections are opened with mode=ro (and query_only) so a stray
+    write on one fails loudly instead of racing the dedicated writer.
+    """
+    os.makedirs(DB_DIR, exist_ok=True)
+    # isolation_level=None: single statements autocommit; multi-statement
+    # writes open their own transaction with _begin().
+    if readonly:
+        get_connection()  # the writer creates the file and switches it to WAL
+        target = pathlib.Path(DB_PATH).as_uri() + "?mode=ro"
+    else:
+        target = DB_PATH
+    conn = sqlite3.connect(target, uri=readonly, check_same_thread=False,
+                           cached_statements=512, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.set_trace_callback(None)  # no per-statement tracing overhead
+    for pragma in _LOCAL_PRAGMAS:
+        # journal_mode/page_size are file-level settings only the writer may change
+        if readonly and pragma.startswith(("PRAGMA journal_mode", "PRAGMA page_size")):
+            continue
+        conn.execute(pragma)
+    if readonly:
+        conn.execute("PRAGMA query_only=1")
+    return conn
+
+
 def get_connection():
-    conn = getattr(_local, 'conn', None)
-    if conn is not None:
+    """Return a Turso connection for this thread, or the local writer connection.
+
+    libsql connections are kept thread-local since they are not safe to hand
+    between threads. Prefer _borrow()/_writer() inside this module.
+    """
+    if USE_TURSO:
+        conn = getattr(_local, 'conn', None)
+        if conn is None:
+            conn = libsql.connect(TURSO_DB_URL, auth_token=TURSO_AUTH_TOKEN)
+            _local.conn = conn
         return conn
+    global _writer_conn
+    with _pool_lock:
+        if _writer_conn is None:
+            _writer_conn = _open_local()
+            # Refresh planner stats if they are missing/stale (cheap otherwise);
+            # the maintenance timer repeats this every 15 minutes.
+            _writer_conn.execute("PRAGMA optimize")
+    return _writer_conn
+
+
+@contextmanager
+def _borrow():
+    """Borrow a reader connection from the pool for the duration of the block."""
     if USE_TURSO:
-        conn = libsql.connect(TURSO_DB_URL, auth_token=TURSO_AUTH_TOKEN)
-    else:
-        os.makedirs(DB_DIR, exist_ok=True)
-        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=ON")
-    _local.conn = conn
-    return conn
+        yield get_connection()
+        return
+    global _read_pool_opened
+    try:
+        conn = _read_pool.get_nowait()
+    except queue.Empty:
+        with _pool_lock:
+            grow = _read_pool_opened < _READ_POOL_SIZE
+            if grow:
+                _read_pool_opened += 1
+        if grow:
+            try:
+                conn = _open_local(readonly=True)
+            except BaseException:
+                with _pool_lock:
+                    _read_pool_opened -= 1  # give the slot back
+                raise
+        else:
+            try:
+                conn = _read_pool.get(timeout=_READ_POOL_WAIT)
+            except queue.Empty:
+                raise sqlite3.OperationalError(
+                    f"no reader connection free after {_READ_POOL_WAIT}s") from None
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        _read_pool.put(conn)
+
+
+@contextmanager
+def _writer():
+    """Hold the single writer connection (serialised across threads)."""
+    if USE_TURSO:
+        yield get_connection()
+        return
+    with _writer_lock:
+        conn = get_connection()
+        try:
+            yield conn
+        except BaseException:
+            # Inside transaction() the outermost block decides what to roll back
+            if conn.in_transaction and not getattr(_local, 'tx_depth', 0):
+                conn.rollback()
+            raise
+
+
+def _begin(conn, mode=''):
+    """Open an explicit transaction for a multi-statement write (if none is open).
+
+    mode is an optional SQLite locking mode ('IMMEDIATE' / 'EXCLUSIVE').
+    """
+    if not getattr(conn, 'in_transaction', False):
+        conn.execute(f"BEGIN {mode}" if mode else "BEGIN")
 
 
 _last_sync_status = ""  # exposed for diagnostics
 
 
 def _commit(conn):
-    """Commit and, for Turso connections, sync to ensure data reaches the remote server."""
-    global _last_sync_status
+    """Commit and, for Turso connections, sync to ensure data reaches the remote server.
+
+    Inside transaction() this is a no-op (the block commits once on exit).
+    Inside batched_writes() the sync is deferred to the end of the batch.
+    The sync always runs on the committing connection: libsql connections
+    are per-thread and can't be synced from anywhere else.
+    """
+    if getattr(_local, 'tx_depth', 0):
+        return
     conn.commit()
+    if getattr(_local, 'batch_depth', 0):
+        _local.sync_pending = True
+        return
+    _sync(conn)
+
+
+def _sync(conn):
+    global _last_sync_status
     if USE_TURSO:
         if hasattr(conn, 'sync'):
             try:
@@ -83,13 +244,178 @@ def _commit(conn):
         _last_sync_status = "local sqlite (no sync needed)"
 
 
+def force_sync():
+    """Sync this thread's connection now, even inside batched_writes().
+
+    For writes that must be durable remotely before the caller continues.
+    No-op beyond status bookkeeping for local sqlite.
+    """
+    _local.sync_pending = False
+    with _writer() as conn:
+        _sync(conn)
+
+
+@contextmanager
+def batched_writes():
+    """Group a burst of writes (e.g. one form save) so Turso syncs once at the end.
+
+    Each write still commits as usual; only the per-commit conn.sync()
+    round-trip is collapsed into one. Nests; the outermost block syncs.
+    """
+    _local.batch_depth = getattr(_local, 'batch_depth', 0) + 1
+    try:
+        yield
+    finally:
+        _local.batch_depth -= 1
+        if not _local.batch_depth and getattr(_local, 'sync_pending', False):
+            _local.sync_pending = False
+            with _writer() as conn:
+                _sync(conn)
+
+
+@contextmanager
+def transaction(*restaurants):
+    """Run every write in the block in one BEGIN IMMEDIATE ... COMMIT.
+
+    Setters called inside skip their own commit, so a form save costs one
+    commit (one fsync / Turso sync) instead of one per setter; an exception
+    rolls the whole block back. Nests; the outermost block commits. Holds the
+    writer for its duration, so keep network calls outside it.
+
+    Pass the restaurants whose images the block touches: their queued
+    save_image() writes land first (other sessions' uploads aren't waited on).
+    """
+    if getattr(_local, 'tx_depth', 0):
+        _local.tx_depth += 1
+        try:
+            yield
+        finally:
+            _local.tx_depth -= 1
+        return
+    if restaurants:
+        flush_images(*restaurants)  # queued saves land before the block's writes
+    try:
+        with _writer() as conn:
+            _begin(conn, 'IMMEDIATE')
+            _local.tx_depth = 1
+            try:
+                yield
+            except BaseException:
+                if getattr(conn, 'in_transaction', True):
+                    conn.rollback()
+                raise
+            finally:
+                _local.tx_depth = 0
+            _commit(conn)
+    finally:
+        _invalidate_all()  # reads cached mid-transaction saw pre-commit data
+
+
+def _invalidate_all():
+    _invalidate_restaurants()
+    with _cache_lock:
+        _copy_cache.clear()
+
+
+def execute_batch(statements):
+    """Run [(sql, params), ...] in one transaction on one connection.
+
+    Returns a list with the fetched rows (as dicts) of each statement; [] for
+    statements that return nothing. All-SELECT batches run on a reader and see
+    one consistent snapshot; anything else goes through the writer and commits
+    once at the end.
+    """
+    is_read = all(sql.lstrip()[:6].upper() == 'SELECT' for sql, _ in statements)
+    with (_borrow() if is_read else _writer()) as conn:
+        started = not getattr(conn, 'in_transaction', False)
+        if started:
+            _begin(conn)
+        else:
+            # Inside transaction(): undo only this batch, not the caller's work
+            conn.execute("SAVEPOINT execute_batch")
+        try:
+            results = []
+            for sql, params in statements:
+                cur = conn.execute(sql, params)
+                results.append(_rows_to_dicts(cur) if cur.description else [])
+        except BaseException:
+            if started:
+                conn.rollback()
+            else:
+                conn.execute("ROLLBACK TO execute_batch")
+                conn.execute("RELEASE execute_batch")
+            raise
+        if not started:
+            # The enclosing transaction owns the commit (on Turso a reader
+            # batch shares the thread's one connection with it)
+            conn.execute("RELEASE execute_batch")
+        elif is_read:
+            conn.commit()
+        else:
+            _commit(conn)
+    if not is_read:
+        # Arbitrary SQL: drop every cached read rather than guess what changed
+        _invalidate_all()
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Schema
 # ---------------------------------------------------------------------------
 
+# Columns added to `restaurants` after the original schema.
+_RESTAURANT_MIGRATIONS = [
+    ('notes', "TEXT DEFAULT ''"),
+    ('primary_color', "TEXT DEFAULT ''"),
+    ('checklist', "TEXT DEFAULT ''"),
+    ('booking_platform', "TEXT DEFAULT ''"),
+    ('opentable_rid', "TEXT DEFAULT ''"),
+    ('pull_data', "INTEGER DEFAULT 0"),
+    ('tripleseat_form_id', "TEXT DEFAULT ''"),
+    ('resy_url', "TEXT DEFAULT ''"),
+    ('mailing_list_url', "TEXT DEFAULT ''"),
+    ('facebook_url', "TEXT DEFAULT ''"),
+    ('instagram_url', "TEXT DEFAULT ''"),
+    ('phone', "TEXT DEFAULT ''"),
+    ('email_general', "TEXT DEFAULT ''"),
+    ('email_events', "TEXT DEFAULT ''"),
+    ('email_marketing', "TEXT DEFAULT ''"),
+    ('email_press', "TEXT DEFAULT ''"),
+    ('address', "TEXT DEFAULT ''"),
+    ('google_maps_url', "TEXT DEFAULT ''"),
+    ('order_online_url', "TEXT DEFAULT ''"),
+]
+
+
+_initialized = set()  # databases init_db has already brought up to date
+# Stored in PRAGMA user_version; bump whenever _apply_schema or the
+# migrations above change so existing databases pick the change up.
+_SCHEMA_VERSION = 1
+
+
 def init_db():
-    """Create tables if they don't exist."""
-    conn = get_connection()
+    """Create tables if they don't exist (once per database per process).
+
+    PRAGMA user_version records the schema version already applied, so warm
+    starts skip the DDL/migration work with a single read.
+    """
+    target = TURSO_DB_URL if USE_TURSO else DB_PATH
+    if target in _initialized:
+        return
+    with _writer() as conn:
+        if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+            _apply_schema(conn)
+            _migrate_inline_images(conn)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            _commit(conn)
+    _initialized.add(target)
+    _start_maintenance()
+
+
+def _apply_schema(conn):
+    # All schema work runs in one exclusive transaction: one commit (and
+    # one Turso sync) for the whole upgrade.
+    _begin(conn, 'EXCLUSIVE')
     # executescript not available in libsql; run statements individually
     stmts = [
         """CREATE TABLE IF NOT EXISTS restaurants (
@@ -107,6 +433,7 @@ def init_db():
             image_data BLOB,
             alt_text TEXT DEFAULT '',
             overlay_opacity INTEGER DEFAULT 40,
+            has_image INTEGER DEFAULT 0,
             FOREIGN KEY (restaurant) REFERENCES restaurants(name) ON DELETE CASCADE,
             UNIQUE(restaurant, field_name)
         )""",
@@ -118,312 +445,826 @@ def init_db():
             FOREIGN KEY (restaurant) REFERENCES restaurants(name) ON DELETE CASCADE,
             UNIQUE(restaurant, section_id)
         )""",
+        # Image payloads live here in ~1 MiB slices so metadata scans of
+        # `images` never walk blob overflow pages.
+        """CREATE TABLE IF NOT EXISTS image_chunks (
+            image_id INTEGER NOT NULL,
+            seq INTEGER NOT NULL,
+            data BLOB NOT NULL,
+            PRIMARY KEY (image_id, seq),
+            FOREIGN KEY (image_id) REFERENCES images(id) ON DELETE CASCADE
+        )""",
     ]
     for sql in stmts:
         conn.execute(sql)
-    # Migrate: add columns if missing (existing databases)
-    # Commit each ALTER individually — on Turso/libsql a failed ALTER
-    # (column already exists) can taint the transaction, so we commit
-    # after each success to keep the connection clean.
-    for col, col_def in [
-        ('notes', "TEXT DEFAULT ''"),
-        ('primary_color', "TEXT DEFAULT ''"),
-        ('checklist', "TEXT DEFAULT ''"),
-        ('booking_platform', "TEXT DEFAULT ''"),
-        ('opentable_rid', "TEXT DEFAULT ''"),
-        ('pull_data', "INTEGER DEFAULT 0"),
-        ('tripleseat_form_id', "TEXT DEFAULT ''"),
-        ('resy_url', "TEXT DEFAULT ''"),
-        ('mailing_list_url', "TEXT DEFAULT ''"),
-        ('facebook_url', "TEXT DEFAULT ''"),
-        ('instagram_url', "TEXT DEFAULT ''"),
-        ('phone', "TEXT DEFAULT ''"),
-        ('email_general', "TEXT DEFAULT ''"),
-        ('email_events', "TEXT DEFAULT ''"),
-        ('email_marketing', "TEXT DEFAULT ''"),
-        ('email_press', "TEXT DEFAULT ''"),
-        ('address', "TEXT DEFAULT ''"),
-        ('google_maps_url', "TEXT DEFAULT ''"),
-        ('order_online_url', "TEXT DEFAULT ''"),
-    ]:
-        try:
+    # Cascade deletes in SQLite itself: ON DELETE CASCADE needs
+    # PRAGMA foreign_keys=ON, which Turso/libsql may not honour.
+    conn.execute("""CREATE TRIGGER IF NOT EXISTS trg_del_restaurant
+        BEFORE DELETE ON restaurants BEGIN
+            DELETE FROM images WHERE restaurant = OLD.name;
+            DELETE FROM copy_sections WHERE restaurant = OLD.name;
+        END""")
+    conn.execute("""CREATE TRIGGER IF NOT EXISTS trg_del_image
+        BEFORE DELETE ON images BEGIN
+            DELETE FROM image_chunks WHERE image_id = OLD.id;
+        END""")
+    # Migrate: add only the columns an existing database is missing
+    # (no per-ALTER commit/sync, no failed ALTERs).
+    have = {r[1] for r in conn.execute("PRAGMA table_info(restaurants)").fetchall()}
+    for col, col_def in _RESTAURANT_MIGRATIONS:
+        if col not in have:
             conn.execute(f"ALTER TABLE restaurants ADD COLUMN {col} {col_def}")
-            _commit(conn)
-        except Exception:
-            pass  # column already exists
+    # has_image is maintained on write so metadata reads never probe the payload
+    if 'has_image' not in {r[1] for r in conn.execute("PRAGMA table_info(images)").fetchall()}:
+        conn.execute("ALTER TABLE images ADD COLUMN has_image INTEGER DEFAULT 0")
+        conn.execute(
+            "UPDATE images SET has_image = "
+            "EXISTS(SELECT 1 FROM image_chunks c WHERE c.image_id = images.id)"
+        )
+    # Covering indexes: the per-restaurant metadata/copy reads are served
+    # from the index alone, without a table lookup per row.
+    conn.execute("DROP INDEX IF EXISTS idx_images_meta")  # superseded by idx_images_cover
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_images_cover ON images"
+        "(restaurant, field_name, alt_text, overlay_opacity, original_filename, has_image)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_copy_cover ON copy_sections"
+        "(restaurant, section_id, content)"
+    )
+    # Matches get_all_restaurants' ORDER BY, so rows come back pre-sorted
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_restaurants_display_nocase "
+        "ON restaurants(display_name COLLATE NOCASE)"
+    )
+    _commit(conn)
+
+
+# ─── Periodic maintenance (local SQLite only) ────────────────────────────────
+# Keeps the -wal file from growing without bound and refreshes planner stats.
+# Turso manages its own storage, so nothing is scheduled there.
+
+_MAINTENANCE_INTERVAL = 15 * 60  # seconds
+_maintenance_lock = threading.Lock()
+_maintenance_timer = None
+
+
+def _run_maintenance():
+    try:
+        with _maintenance_lock:
+            conn = _open_local()
+            try:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                conn.execute("PRAGMA optimize")
+            finally:
+                conn.close()
+    except Exception:
+        pass  # best effort; try again next interval
+    _schedule_maintenance()
+
+
+def _schedule_maintenance():
+    global _maintenance_timer
+    _maintenance_timer = threading.Timer(_MAINTENANCE_INTERVAL, _run_maintenance)
+    _maintenance_timer.daemon = True
+    _maintenance_timer.start()
+
+
+def _start_maintenance():
+    """Start the maintenance timer once per process."""
+    if USE_TURSO:
+        return
+    with _maintenance_lock:
+        if _maintenance_timer is None:
+            _schedule_maintenance()
+
+
+def _migrate_inline_images(conn):
+    """One-time move of legacy images.image_data blobs into image_chunks."""
+    ids = [r[0] for r in conn.execute(
+        "SELECT id FROM images WHERE image_data IS NOT NULL").fetchall()]
+    for image_id in ids:
+        _begin(conn)
+        row = conn.execute("SELECT image_data FROM images WHERE id = ?", (image_id,)).fetchone()
+        _write_chunks(conn, image_id, row[0])
+        conn.execute("UPDATE images SET image_data = NULL, has_image = 1 WHERE id = ?", (image_id,))
+        _commit(conn)
+
+
+# ─── Read caches ─────────────────────────────────────────────────────────────
+# The restaurant list and copy are read on nearly every rerun but change
+# rarely. Results are kept briefly and dropped by the matching writers.
+
+_CACHE_TTL = 5  # seconds
+_cache_lock = threading.Lock()
+_restaurants_cache = {'ts': 0.0, 'val': None}
+_copy_cache = {}  # restaurant -> (ts, {section_id: content})
+_cache_gen = [0]  # bumped on every invalidation so in-flight reads don't repopulate stale data
+
+
+def _invalidate_restaurants():
+    with _cache_lock:
+        _restaurants_cache['val'] = None
+        _cache_gen[0] += 1
+
+
+def _invalidate_copy(restaurant):
+    with _cache_lock:
+        _copy_cache.pop(restaurant, None)
+        _cache_gen[0] += 1
 
 
 # ─── Restaurant CRUD ─────────────────────────────────────────────────────────
 
+# Columns update_restaurant() may set (column names are interpolated into SQL).
+_UPDATABLE_COLUMNS = frozenset({
+    'display_name', 'website_url', 'notes', 'primary_color', 'checklist',
+    'booking_platform', 'opentable_rid', 'pull_data', 'tripleseat_form_id',
+    'resy_url', 'mailing_list_url', 'facebook_url', 'instagram_url', 'phone',
+    'email_general', 'email_events', 'email_marketing', 'email_press',
+    'address', 'google_maps_url', 'order_online_url',
+})
+
+
+def update_restaurant(name, **fields):
+    """Set several restaurant columns in one UPDATE and one commit.
+
+    Columns whose stored value already matches are left out; if nothing
+    differs, no UPDATE (and no commit/sync) is issued at all.
+    """
+    if not fields:
+        return
+    unknown = set(fields) - _UPDATABLE_COLUMNS
+    if unknown:
+        raise ValueError(f"Unknown restaurant column(s): {', '.join(sorted(unknown))}")
+    if 'pull_data' in fields:
+        fields['pull_data'] = int(fields['pull_data'])
+    with _writer() as conn:
+        current = conn.execute(
+            "SELECT " + ", ".join(fields) + " FROM restaurants WHERE name = ?", (name,)
+        ).fetchone()
+        if current is None:
+            return  # no such restaurant; the UPDATE would match nothing
+        changed = {k: v for (k, v), old in zip(fields.items(), current) if v != old}
+        if not changed:
+            return
+        sql = "UPDATE restaurants SET " + ", ".join(f"{k} = ?" for k in changed) + " WHERE name = ?"
+        conn.execute(sql, (*changed.values(), name))
+        _commit(conn)
+    _invalidate_restaurants()
+
+
+_RESTAURANT_COLUMNS = (
+    'name', 'display_name', 'website_url', 'notes', 'primary_color', 'checklist',
+    'booking_platform', 'opentable_rid', 'pull_data', 'tripleseat_form_id', 'resy_url',
+    'mailing_list_url', 'facebook_url', 'instagram_url', 'phone', 'email_general',
+    'email_events', 'email_marketing', 'email_press', 'address', 'google_maps_url',
+    'order_online_url',
+)
+_RESTAURANT_SELECT_SQL = (
+    "SELECT " + ", ".join(_RESTAURANT_COLUMNS)
+    + " FROM restaurants ORDER BY display_name COLLATE NOCASE"
+)
+_ADD_RESTAURANT_SQL = (
+    "INSERT OR IGNORE INTO restaurants (name, display_name, website_url) VALUES (?, ?, ?) "
+    "RETURNING " + ", ".join(_RESTAURANT_COLUMNS)
+)
+_DELETE_RESTAURANT_SQL = "DELETE FROM restaurants WHERE name = ?"
+
+
 def add_restaurant(name, display_name, website_url=''):
-    conn = get_connection()
-    conn.execute(
-        "INSERT OR IGNORE INTO restaurants (name, display_name, website_url) VALUES (?, ?, ?)",
-        (name, display_name, website_url)
-    )
-    _commit(conn)
+    """Insert a restaurant; return the new row as a dict (None if it already existed)."""
+    with _writer() as conn:
+        rows = conn.execute(_ADD_RESTAURANT_SQL, (name, display_name, website_url)).fetchall()
+        _commit(conn)
+    _invalidate_restaurants()
+    return dict(zip(_RESTAURANT_COLUMNS, rows[0])) if rows else None
 
 
 def update_restaurant_url(name, website_url):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET website_url = ? WHERE name = ?", (website_url, name))
-    _commit(conn)
+    update_restaurant(name, website_url=website_url)
 
 
 def update_restaurant_color(name, primary_color):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET primary_color = ? WHERE name = ?", (primary_color, name))
-    _commit(conn)
+    update_restaurant(name, primary_color=primary_color)
 
 
 def update_restaurant_checklist(name, checklist_json):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET checklist = ? WHERE name = ?", (checklist_json, name))
-    _commit(conn)
+    update_restaurant(name, checklist=checklist_json)
 
 
 def update_restaurant_booking(name, booking_platform):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET booking_platform = ? WHERE name = ?", (booking_platform, name))
-    _commit(conn)
+    update_restaurant(name, booking_platform=booking_platform)
 
 
 def update_restaurant_opentable_rid(name, opentable_rid):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET opentable_rid = ? WHERE name = ?", (opentable_rid, name))
-    _commit(conn)
+    update_restaurant(name, opentable_rid=opentable_rid)
 
 
 def update_restaurant_tripleseat(name, tripleseat_form_id):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET tripleseat_form_id = ? WHERE name = ?", (tripleseat_form_id, name))
-    _commit(conn)
+    update_restaurant(name, tripleseat_form_id=tripleseat_form_id)
 
 
 def update_restaurant_resy_url(name, resy_url):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET resy_url = ? WHERE name = ?", (resy_url, name))
-    _commit(conn)
+    update_restaurant(name, resy_url=resy_url)
 
 
 def update_restaurant_mailing_list_url(name, mailing_list_url):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET mailing_list_url = ? WHERE name = ?", (mailing_list_url, name))
-    _commit(conn)
+    update_restaurant(name, mailing_list_url=mailing_list_url)
 
 
 def update_restaurant_facebook_url(name, facebook_url):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET facebook_url = ? WHERE name = ?", (facebook_url, name))
-    _commit(conn)
+    update_restaurant(name, facebook_url=facebook_url)
 
 
 def update_restaurant_instagram_url(name, instagram_url):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET instagram_url = ? WHERE name = ?", (instagram_url, name))
-    _commit(conn)
+    update_restaurant(name, instagram_url=instagram_url)
 
 
 def update_restaurant_phone(name, phone):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET phone = ? WHERE name = ?", (phone, name))
-    _commit(conn)
+    update_restaurant(name, phone=phone)
 
 
 def update_restaurant_email_general(name, email_general):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET email_general = ? WHERE name = ?", (email_general, name))
-    _commit(conn)
+    update_restaurant(name, email_general=email_general)
 
 
 def update_restaurant_email_events(name, email_events):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET email_events = ? WHERE name = ?", (email_events, name))
-    _commit(conn)
+    update_restaurant(name, email_events=email_events)
 
 
 def update_restaurant_email_marketing(name, email_marketing):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET email_marketing = ? WHERE name = ?", (email_marketing, name))
-    _commit(conn)
+    update_restaurant(name, email_marketing=email_marketing)
 
 
 def update_restaurant_email_press(name, email_press):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET email_press = ? WHERE name = ?", (email_press, name))
-    _commit(conn)
+    update_restaurant(name, email_press=email_press)
 
 
 def update_restaurant_address(name, address):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET address = ? WHERE name = ?", (address, name))
-    _commit(conn)
+    update_restaurant(name, address=address)
 
 
 def update_restaurant_google_maps_url(name, google_maps_url):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET google_maps_url = ? WHERE name = ?", (google_maps_url, name))
-    _commit(conn)
+    update_restaurant(name, google_maps_url=google_maps_url)
 
 
 def update_restaurant_order_online_url(name, order_online_url):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET order_online_url = ? WHERE name = ?", (order_online_url, name))
-    _commit(conn)
+    update_restaurant(name, order_online_url=order_online_url)
 
 
 def update_restaurant_pull_data(name, pull_data):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET pull_data = ? WHERE name = ?", (int(pull_data), name))
-    _commit(conn)
+    update_restaurant(name, pull_data=pull_data)
 
 
 def get_all_restaurants():
-    """Return list of dicts with all restaurant columns."""
-    conn = get_connection()
-    cur = conn.execute(
-        "SELECT name, display_name, website_url, notes, primary_color, checklist,"
-        " booking_platform, opentable_rid, pull_data, tripleseat_form_id, resy_url,"
-        " mailing_list_url, facebook_url, instagram_url, phone, email_general,"
-        " email_events, email_marketing, email_press, address, google_maps_url,"
-        " order_online_url"
-        " FROM restaurants ORDER BY display_name COLLATE NOCASE"
-    )
-    results = _rows_to_dicts(cur)
-    return results
+    """Return list of dicts with all restaurant columns (cached for a few seconds)."""
+    with _cache_lock:
+        if (_restaurants_cache['val'] is not None
+                and time.monotonic() - _restaurants_cache['ts'] < _CACHE_TTL):
+            return [dict(r) for r in _restaurants_cache['val']]
+        gen = _cache_gen[0]
+    with _borrow() as conn:
+        cur = conn.execute(_RESTAURANT_SELECT_SQL)
+        results = _rows_to_dicts(cur, _RESTAURANT_COLUMNS)
+    with _cache_lock:
+        if gen == _cache_gen[0]:  # skip if a write landed mid-query
+            _restaurants_cache['val'] = results
+            _restaurants_cache['ts'] = time.monotonic()
+    return [dict(r) for r in results]
 
 
 def update_restaurant_notes(name, notes):
-    conn = get_connection()
-    conn.execute("UPDATE restaurants SET notes = ? WHERE name = ?", (notes, name))
-    _commit(conn)
+    update_restaurant(name, notes=notes)
 
 
 def delete_restaurant(name):
     """Delete restaurant and all associated data from DB."""
-    conn = get_connection()
-    # Explicit deletes — ON DELETE CASCADE requires PRAGMA foreign_keys=ON
-    # which Turso/libsql may not support
-    conn.execute("DELETE FROM images WHERE restaurant = ?", (name,))
-    conn.execute("DELETE FROM copy_sections WHERE restaurant = ?", (name,))
-    conn.execute("DELETE FROM restaurants WHERE name = ?", (name,))
-    _commit(conn)
+    flush_images(name)
+    with _writer() as conn:
+        # trg_del_restaurant / trg_del_image remove images, chunks and copy
+        conn.execute(_DELETE_RESTAURANT_SQL, (name,))
+        _commit(conn)
+    _invalidate_restaurants()
+    _invalidate_copy(name)
+
+
+_COPY_RESTAURANT_SQL = (
+    "INSERT INTO restaurants (" + ", ".join(_RESTAURANT_COLUMNS) + ") "
+    "SELECT ?, COALESCE(?, display_name), " + ", ".join(_RESTAURANT_COLUMNS[2:])
+    + " FROM restaurants WHERE name = ?"
+)
+_COPY_IMAGES_SQL = (
+    "INSERT INTO images (restaurant, field_name, original_filename, image_data, "
+    "alt_text, overlay_opacity, has_image) "
+    "SELECT ?, field_name, original_filename, image_data, alt_text, overlay_opacity, has_image "
+    "FROM images WHERE restaurant = ?"
+)
+_COPY_CHUNKS_SQL = (
+    "INSERT INTO image_chunks (image_id, seq, data) "
+    "SELECT d.id, c.seq, c.data FROM image_chunks c "
+    "JOIN images s ON s.id = c.image_id "
+    "JOIN images d ON d.restaurant = ? AND d.field_name = s.field_name "
+    "WHERE s.restaurant = ?"
+)
+_COPY_SECTIONS_SQL = (
+    "INSERT INTO copy_sections (restaurant, section_id, content) "
+    "SELECT ?, section_id, content FROM copy_sections WHERE restaurant = ?"
+)
+
+
+def duplicate_restaurant(src, dst, display_name=None):
+    """Clone a restaurant with its images and copy under a new name.
+
+    Runs as INSERT ... SELECT inside one transaction, so rows (and image
+    blobs) are copied by SQLite itself and never travel through Python.
+    Returns False if src does not exist; raises if dst already does.
+    """
+    flush_images(src, dst)
+    with _writer() as conn:
+        started = not getattr(conn, 'in_transaction', False)
+        _begin(conn)
+        cur = conn.execute(_COPY_RESTAURANT_SQL, (dst, display_name, src))
+        if cur.rowcount == 0:
+            # Nothing was written; only end a transaction we opened ourselves
+            if started:
+                conn.rollback()
+            return False
+        conn.execute(_COPY_IMAGES_SQL, (dst, src))
+        conn.execute(_COPY_CHUNKS_SQL, (dst, src))
+        conn.execute(_COPY_SECTIONS_SQL, (dst, src))
+        _commit(conn)
+    _invalidate_restaurants()
+    _invalidate_copy(dst)
+    return True
 
 
 # ─── Image CRUD ──────────────────────────────────────────────────────────────
 
+_CHUNK_SIZE = 1 << 20  # 1 MiB per image_chunks row
+
+
+# Hot-path SQL kept as module constants: identical text on every call lets
+# the driver's statement cache reuse the compiled statement.
+_UPSERT_IMAGE_SQL = (
+    "INSERT INTO images (restaurant, field_name, original_filename, image_data, alt_text, overlay_opacity, has_image) "
+    "VALUES (?, ?, ?, NULL, ?, ?, ?) "
+    "ON CONFLICT(restaurant, field_name) DO UPDATE SET "
+    "original_filename = excluded.original_filename, image_data = NULL, "
+    "alt_text = excluded.alt_text, overlay_opacity = excluded.overlay_opacity, "
+    "has_image = excluded.has_image"
+)
+_IMAGE_ID_SQL = "SELECT id FROM images WHERE restaurant = ? AND field_name = ?"
+_DELETE_CHUNKS_SQL = "DELETE FROM image_chunks WHERE image_id = ?"
+_INSERT_CHUNK_SQL = "INSERT INTO image_chunks (image_id, seq, data) VALUES (?, ?, ?)"
+_UPDATE_ALT_SQL = "UPDATE images SET alt_text = ? WHERE restaurant = ? AND field_name = ?"
+_UPDATE_OVERLAY_SQL = "UPDATE images SET overlay_opacity = ? WHERE restaurant = ? AND field_name = ?"
+_DELETE_IMAGE_SQL = "DELETE FROM images WHERE restaurant = ? AND field_name = ?"
+_IMAGE_META_SQL = (
+    "SELECT field_name, alt_text, overlay_opacity, original_filename, has_image "
+    "FROM images WHERE restaurant = ?"
+)
+_IMAGE_RECORD_SQL = (
+    "SELECT field_name, alt_text, overlay_opacity, original_filename "
+    "FROM images WHERE restaurant = ? AND field_name = ?"
+)
+_HAS_IMAGE_SQL = "SELECT has_image FROM images WHERE restaurant = ? AND field_name = ?"
+_CHUNK_ROWIDS_SQL = (
+    "SELECT c.rowid FROM image_chunks c JOIN images i ON i.id = c.image_id "
+    "WHERE i.restaurant = ? AND i.field_name = ? ORDER BY c.seq"
+)
+_SELECT_CHUNKS_SQL = (
+    "SELECT c.data FROM image_chunks c JOIN images i ON i.id = c.image_id "
+    "WHERE i.restaurant = ? AND i.field_name = ? ORDER BY c.seq"
+)
+
+
+def _write_chunks(conn, image_id, image_bytes):
+    """Replace the stored chunks of an image with slices of image_bytes."""
+    conn.execute(_DELETE_CHUNKS_SQL, (image_id,))
+    if image_bytes:
+        # sqlite3 binds any buffer, so memoryview slices hand each chunk to
+        # SQLite without first copying it into a new bytes object. libsql
+        # only documents bytes, so Turso keeps plain slicing.
+        data = image_bytes if USE_TURSO else memoryview(image_bytes).cast('B')
+        conn.executemany(
+            _INSERT_CHUNK_SQL,
+            [(image_id, seq, data[off:off + _CHUNK_SIZE])
+             for seq, off in enumerate(range(0, len(data), _CHUNK_SIZE))]
+        )
+
+
+def _write_image(conn, restaurant, field_name, image_bytes, original_filename, alt_text, overlay_opacity):
+    conn.execute(_UPSERT_IMAGE_SQL,
+                 (restaurant, field_name, original_filename, alt_text, overlay_opacity,
+                  1 if image_bytes else 0))
+    image_id = conn.execute(_IMAGE_ID_SQL, (restaurant, field_name)).fetchone()[0]
+    _write_chunks(conn, image_id, _encode_image(image_bytes))
+
+
+# Image writes are handed to a background thread so multi-MB blob inserts
+# (and their commit/sync) don't block the Streamlit script run. Queued
+# saves are drained in batches of up to _IMAGE_BATCH_MAX per commit. Each
+# save_images() call gets its own Future carrying its own outcome; readers
+# only wait for the saves queued for the restaurants they read.
+_IMAGE_BATCH_MAX = 16
+_IMAGE_FLUSH_TIMEOUT = 60  # seconds a reader waits for queued saves
+_image_queue = queue.Queue()
+_image_thread = None
+_image_thread_lock = threading.Lock()
+_pending_images = {}  # restaurant -> Futures of queued saves not yet written
+_pending_lock = threading.Lock()
+
+
+def _image_writer_loop():
+    while True:
+        # Queue entries are (future, records), one per save_image/save_images call
+        groups = [_image_queue.get()]
+        while sum(len(records) for _, records in groups) < _IMAGE_BATCH_MAX:
+            try:
+                groups.append(_image_queue.get_nowait())
+            except queue.Empty:
+                break
+        # Futures cancelled while queued are dropped; the rest can no longer be
+        # cancelled, so setting their outcome below can't fail
+        live = [(future, records) for future, records in groups
+                if future.set_running_or_notify_cancel()]
+        try:
+            try:
+                with _writer() as conn:
+                    _begin(conn)
+                    for _, records in live:
+                        for item in records:
+                            _write_image(conn, *item)
+                    _commit(conn)
+            except Exception:
+                # One bad save must not sink the rest: retry each call on its own
+                for future, records in live:
+                    try:
+                        with _writer() as conn:
+                            _begin(conn)
+                            for item in records:
+                                _write_image(conn, *item)
+                            _commit(conn)
+                    except Exception as e:
+                        future.set_exception(e)
+                    else:
+                        future.set_result(None)
+            else:
+                for future, _ in live:
+                    future.set_result(None)
+        finally:
+            for _ in groups:
+                _image_queue.task_done()
+
+
+def _enqueue_images(records):
+    global _image_thread
+    with _image_thread_lock:
+        if _image_thread is None:
+            _image_thread = threading.Thread(target=_image_writer_loop, name="db-image-writer", daemon=True)
+            _image_thread.start()
+    future = Future()
+    restaurants = {r[0] for r in records}
+    with _pending_lock:
+        for name in restaurants:
+            _pending_images.setdefault(name, set()).add(future)
+    future.add_done_callback(lambda f: _forget_pending(f, restaurants))
+    _image_queue.put((future, records))
+    return future
+
+
+def _forget_pending(future, restaurants):
+    with _pending_lock:
+        for name in restaurants:
+            pending = _pending_images.get(name)
+            if pending is not None:
+                pending.discard(future)
+                if not pending:
+                    del _pending_images[name]
+
+
 def save_image(restaurant, field_name, image_bytes, original_filename, alt_text='', overlay_opacity=40):
-    """Save processed image bytes as a BLOB in the database."""
-    conn = get_connection()
-    conn.execute("""
-        INSERT INTO images (restaurant, field_name, original_filename, image_data, alt_text, overlay_opacity)
-        VALUES (?, ?, ?, ?, ?, ?)
-        ON CONFLICT(restaurant, field_name) DO UPDATE SET
-            original_filename = excluded.original_filename,
-            image_data = excluded.image_data,
-            alt_text = excluded.alt_text,
-            overlay_opacity = excluded.overlay_opacity
-    """, (restaurant, field_name, original_filename, image_bytes, alt_text, overlay_opacity))
-    _commit(conn)
+    """Queue processed image bytes to be stored (as image_chunks rows) in the background.
+
+    Returns a Future immediately; image_bytes must not be mutated afterwards.
+    future.result() waits for the write and re-raises its failure. Readers
+    of the restaurant call flush_images() first, so they see queued saves.
+    """
+    return save_images([(restaurant, field_name, image_bytes, original_filename, alt_text, overlay_opacity)])
+
+
+def save_images(records):
+    """Queue several images to be written in one transaction (one commit/sync).
+
+    records: iterable of (restaurant, field_name, image_bytes, original_filename,
+    alt_text, overlay_opacity) tuples. Returns a Future like save_image(); the
+    records are written all-or-nothing.
+    """
+    records = [tuple(r) for r in records]
+    if records and not getattr(_local, 'tx_depth', 0):
+        return _enqueue_images(records)
+    if records:
+        # Part of the caller's transaction: write inline so it commits with it
+        with _writer() as conn:
+            for item in records:
+                _write_image(conn, *item)
+    future = Future()
+    future.set_result(None)
+    return future
+
+
+def flush_images(*restaurants):
+    """Block until the queued saves for the given restaurants (all, if none
+    are given) are written.
+
+    Write failures are not raised here: they belong to the Future returned
+    by the save that queued them. Raises TimeoutError if the saves are still
+    pending after _IMAGE_FLUSH_TIMEOUT seconds. Inside transaction() this
+    returns at once: this thread holds the writer, so the image writer
+    cannot drain the queue until the block ends.
+    """
+    if getattr(_local, 'tx_depth', 0):
+        return
+    with _pending_lock:
+        if restaurants:
+            futures = set().union(*(_pending_images.get(name, ()) for name in restaurants))
+        else:
+            futures = set().union(*_pending_images.values())
+    if wait_futures(futures, timeout=_IMAGE_FLUSH_TIMEOUT).not_done:
+        raise TimeoutError(f"queued image saves still pending after {_IMAGE_FLUSH_TIMEOUT}s")
+
+
+atexit.register(lambda: _image_queue.join())
 
 
 def delete_image(restaurant, field_name):
-    """Delete a single image record from the database."""
-    conn = get_connection()
-    conn.execute(
-        "DELETE FROM images WHERE restaurant = ? AND field_name = ?",
-        (restaurant, field_name)
-    )
-    _commit(conn)
+    """Delete a single image record (trg_del_image drops its chunks)."""
+    flush_images(restaurant)
+    with _writer() as conn:
+        conn.execute(_DELETE_IMAGE_SQL, (restaurant, field_name))
+        _commit(conn)
 
 
 def update_alt_text(restaurant, field_name, alt_text):
-    conn = get_connection()
-    conn.execute(
-        "UPDATE images SET alt_text = ? WHERE restaurant = ? AND field_name = ?",
-        (alt_text, restaurant, field_name)
-    )
-    _commit(conn)
+    flush_images(restaurant)
+    with _writer() as conn:
+        conn.execute(_UPDATE_ALT_SQL, (alt_text, restaurant, field_name))
+        _commit(conn)
 
 
 def update_overlay(restaurant, field_name, overlay_opacity):
-    conn = get_connection()
-    conn.execute(
-        "UPDATE images SET overlay_opacity = ? WHERE restaurant = ? AND field_name = ?",
-        (overlay_opacity, restaurant, field_name)
-    )
-    _commit(conn)
+    flush_images(restaurant)
+    with _writer() as conn:
+        conn.execute(_UPDATE_OVERLAY_SQL, (overlay_opacity, restaurant, field_name))
+        _commit(conn)
 
 
 def get_images_for_restaurant(restaurant):
     """Return dict of field_name -> {alt_text, overlay_opacity, original_filename, has_image}.
     Does NOT return image_data to avoid loading all blobs into memory at once."""
-    conn = get_connection()
-    cur = conn.execute(
-        "SELECT field_name, alt_text, overlay_opacity, original_filename, "
-        "(CASE WHEN image_data IS NOT NULL THEN 1 ELSE 0 END) AS has_image "
-        "FROM images WHERE restaurant = ?",
-        (restaurant,)
-    )
-    rows = _rows_to_dicts(cur)
+    flush_images(restaurant)
+    with _borrow() as conn:
+        cur = conn.execute(_IMAGE_META_SQL, (restaurant,))
+        rows = _rows_to_dicts(cur)
     return {r['field_name']: r for r in rows}
 
 
+def get_all_images(restaurant):
+    """Return dict of field_name -> {image_data, alt_text, overlay_opacity, original_filename}
+    for every image of a restaurant (metadata and chunks read in one batch)."""
+    flush_images(restaurant)
+    rows, chunk_rows = execute_batch([
+        ("SELECT field_name, alt_text, overlay_opacity, original_filename "
+         "FROM images WHERE restaurant = ?", (restaurant,)),
+        ("SELECT i.field_name, c.data FROM image_chunks c "
+         "JOIN images i ON i.id = c.image_id "
+         "WHERE i.restaurant = ? ORDER BY c.image_id, c.seq", (restaurant,)),
+    ])
+    parts = {}
+    for c in chunk_rows:
+        parts.setdefault(c['field_name'], []).append(c['data'])
+    for r in rows:
+        chunks = parts.get(r['field_name'])
+        r['image_data'] = _decode_image(_join_chunks(chunks)) if chunks else None
+    return {r['field_name']: r for r in rows}
+
+
+def _join_chunks(chunks):
+    """Join chunk blobs into one bytes value.
+
+    A single chunk is returned as-is when it is already bytes (sqlite3 always
+    materialises blobs as bytes); other buffer types, such as a libsql
+    memoryview, are copied once so callers get an owned, hashable value.
+    """
+    if len(chunks) == 1:
+        blob = chunks[0]
+        return blob if isinstance(blob, (bytes, bytearray)) else bytes(blob)
+    return b"".join(chunks)
+
+
+def _select_chunks(conn, restaurant, field_name):
+    return conn.execute(_SELECT_CHUNKS_SQL, (restaurant, field_name))
+
+
+# Stored payloads may be zstd-compressed; they are tagged with this prefix.
+# Already-compressed image formats are stored as-is (no gain, wasted CPU).
+_ZSTD_MAGIC = b"ZSTD1"
+_COMPRESSED_IMAGE_MAGICS = (b"\xff\xd8", b"\x89PNG", b"GIF8", b"RIFF")
+
+
+def _encode_image(image_bytes):
+    """Return the payload to store: zstd-compressed if that saves at least 5%."""
+    if (zstandard is None or not image_bytes
+            or bytes(image_bytes[:4]).startswith(_COMPRESSED_IMAGE_MAGICS)):
+        return image_bytes
+    packed = zstandard.ZstdCompressor(level=3).compress(image_bytes)
+    if len(packed) + len(_ZSTD_MAGIC) >= 0.95 * len(image_bytes):
+        return image_bytes
+    return _ZSTD_MAGIC + packed
+
+
+def _zstd_decompressor():
+    if zstandard is None:
+        raise RuntimeError(
+            "image is stored zstd-compressed but the 'zstandard' package is not "
+            "installed (pip install zstandard)"
+        )
+    return zstandard.ZstdDecompressor()
+
+
+def _decode_image(payload):
+    """Inverse of _encode_image (uncompressed rows pass through untouched)."""
+    if payload[:len(_ZSTD_MAGIC)] == _ZSTD_MAGIC:
+        # memoryview: skip the tag without copying the whole compressed blob
+        return _zstd_decompressor().decompress(memoryview(payload)[len(_ZSTD_MAGIC):])
+    return payload
+
+
+def open_image_blob(restaurant, field_name, read_size=65536):
+    """Yield the stored image bytes piece by piece (yields nothing if there is no image).
+
+    Local SQLite reads each chunk row through incremental blob I/O in
+    read_size pieces, so not even a whole 1 MiB chunk is buffered at once.
+    The whole stream comes from one read snapshot on a dedicated (unpooled)
+    connection, so a concurrent re-save can't splice two images together;
+    the connection closes when the generator is exhausted or closed.
+    Turso has no blob handle and reads the chunk rows in one query.
+    Compressed payloads are decompressed incrementally as they stream.
+    """
+    flush_images(restaurant)
+    pieces = _iter_stored_pieces(restaurant, field_name, read_size)
+    first = next(pieces, None)
+    if first is None:
+        return
+    if first[:len(_ZSTD_MAGIC)] != _ZSTD_MAGIC:
+        yield first
+        yield from pieces
+        return
+    dec = _zstd_decompressor().decompressobj()
+    for piece in _prepend(first[len(_ZSTD_MAGIC):], pieces):
+        out = dec.decompress(piece)
+        if out:
+            yield out
+
+
+def _prepend(first, rest):
+    yield first
+    yield from rest
+
+
+def _iter_stored_pieces(restaurant, field_name, read_size):
+    """Yield the stored (possibly compressed) payload of an image in pieces,
+    all read from one consistent snapshot."""
+    if USE_TURSO:
+        with _borrow() as conn:
+            chunks = [r[0] for r in _select_chunks(conn, restaurant, field_name).fetchall()]
+        yield from chunks
+        return
+    conn = _open_local(readonly=True)
+    try:
+        _begin(conn)  # read transaction: pins the snapshot for every piece
+        rowids = [r[0] for r in conn.execute(_CHUNK_ROWIDS_SQL, (restaurant, field_name)).fetchall()]
+        for rowid in rowids:
+            with conn.blobopen("image_chunks", "data", rowid, readonly=True) as blob:
+                piece = blob.read(read_size)
+                while piece:
+                    yield piece
+                    piece = blob.read(read_size)
+    finally:
+        conn.close()
+
+
 def get_image_data(restaurant, field_name):
     """Return the raw image bytes for a single field, or None."""
-    conn = get_connection()
-    cur = conn.execute(
-        "SELECT image_data FROM images WHERE restaurant = ? AND field_name = ?",
-        (restaurant, field_name)
-    )
-    row = _row_to_dict(cur)
-    if row and row['image_data']:
-        return bytes(row['image_data'])
-    return None
+    flush_images(restaurant)
+    with _borrow() as conn:
+        chunks = [r[0] for r in _select_chunks(conn, restaurant, field_name).fetchall()]
+    return _decode_image(_join_chunks(chunks)) if chunks else None
+
+
+def has_image(restaurant, field_name):
+    """Return True if image data is stored for a field (reads the has_image
+    flag only; no chunk pages are touched)."""
+    flush_images(restaurant)
+    with _borrow() as conn:
+        row = conn.execute(_HAS_IMAGE_SQL, (restaurant, field_name)).fetchone()
+    return bool(row and row[0])
 
 
 def get_image_record(restaurant, field_name):
     """Return metadata (no blob) for a single image field."""
-    conn = get_connection()
-    cur = conn.execute(
-        "SELECT field_name, alt_text, overlay_opacity, original_filename "
-        "FROM images WHERE restaurant = ? AND field_name = ?",
-        (restaurant, field_name)
-    )
-    result = _row_to_dict(cur)
-    return result
+    flush_images(restaurant)
+    with _borrow() as conn:
+        cur = conn.execute(_IMAGE_RECORD_SQL, (restaurant, field_name))
+        result = _row_to_dict(cur)
+        return result
 
 
 # ─── Copy CRUD ────────────────────────────────────────────────────────────────
 
+_SELECT_COPY_SQL = "SELECT section_id, content FROM copy_sections WHERE restaurant = ?"
+_UPSERT_COPY_SQL = (
+    "INSERT INTO copy_sections (restaurant, section_id, content) VALUES (?, ?, ?) "
+    "ON CONFLICT(restaurant, section_id) DO UPDATE SET content = excluded.content"
+)
+
+
 def save_copy_section(restaurant, section_id, content):
-    conn = get_connection()
-    conn.execute("""
-        INSERT INTO copy_sections (restaurant, section_id, content)
-        VALUES (?, ?, ?)
-        ON CONFLICT(restaurant, section_id) DO UPDATE SET content = excluded.content
-    """, (restaurant, section_id, content))
-    _commit(conn)
+    save_all_copy(restaurant, {section_id: content})
 
 
 def get_copy_for_restaurant(restaurant):
-    """Return dict of section_id -> content."""
-    conn = get_connection()
-    cur = conn.execute(
-        "SELECT section_id, content FROM copy_sections WHERE restaurant = ?",
-        (restaurant,)
-    )
-    rows = _rows_to_dicts(cur)
-    return {r['section_id']: r['content'] for r in rows}
+    """Return dict of section_id -> content (cached for a few seconds)."""
+    with _cache_lock:
+        hit = _copy_cache.get(restaurant)
+        if hit is not None and time.monotonic() - hit[0] < _CACHE_TTL:
+            return dict(hit[1])
+        gen = _cache_gen[0]
+    with _borrow() as conn:
+        # Reshaped straight from the row tuples; no intermediate per-row dicts
+        result = dict(conn.execute(_SELECT_COPY_SQL, (restaurant,)).fetchall())
+    with _cache_lock:
+        if gen == _cache_gen[0]:
+            _copy_cache[restaurant] = (time.monotonic(), result)
+    return dict(result)
 
 
 def save_all_copy(restaurant, copy_dict):
-    """Save multiple copy sections at once."""
-    conn = get_connection()
-    for section_id, content in copy_dict.items():
-        conn.execute("""
-            INSERT INTO copy_sections (restaurant, section_id, content)
-            VALUES (?, ?, ?)
-            ON CONFLICT(restaurant, section_id) DO UPDATE SET content = excluded.content
-        """, (restaurant, section_id, content))
-    _commit(conn)
+    """Save multiple copy sections at once (one executemany, one commit)."""
+    params = [(restaurant, section_id, content) for section_id, content in copy_dict.items()]
+    if not params:
+        return  # nothing to write; skip the empty transaction (and Turso sync)
+    with _writer() as conn:
+        _begin(conn)
+        conn.executemany(_UPSERT_COPY_SQL, params)
+        _commit(conn)
+    _invalidate_copy(restaurant)
+
+
+# ─── Dashboard ────────────────────────────────────────────────────────────────
+
+_DASHBOARD_IMAGES_SQL = (
+    "SELECT restaurant, field_name, alt_text, overlay_opacity, original_filename, has_image "
+    "FROM images"
+)
+_DASHBOARD_COPY_SQL = "SELECT restaurant, section_id, content FROM copy_sections"
+# Page-filtered variants; {} takes one "?" placeholder per restaurant name
+_DASHBOARD_RESTAURANTS_IN_SQL = (
+    "SELECT " + ", ".join(_RESTAURANT_COLUMNS)
+    + " FROM restaurants WHERE name IN ({}) ORDER BY display_name COLLATE NOCASE"
+)
+_DASHBOARD_IMAGES_IN_SQL = _DASHBOARD_IMAGES_SQL + " WHERE restaurant IN ({})"
+_DASHBOARD_COPY_IN_SQL = _DASHBOARD_COPY_SQL + " WHERE restaurant IN ({})"
+
+
+def get_dashboard_bundle(names=None):
+    """Return {restaurant: {'restaurant': {...}, 'images': {...}, 'copy': {...}}}
+    in display order, using three queries in total (one consistent snapshot).
+
+    `names` restricts the bundle to those restaurants (e.g. the visible page).
+    """
+    if names is None:
+        # Full load (session start): reads committed state rather than waiting
+        # on every session's in-flight uploads
+        statements = [(_RESTAURANT_SELECT_SQL, ()), (_DASHBOARD_IMAGES_SQL, ()),
+                      (_DASHBOARD_COPY_SQL, ())]
+    else:
+        params = tuple(names)
+        if not params:
+            return {}
+        flush_images(*params)
+        placeholders = ",".join("?" * len(params))
+        statements = [(sql.format(placeholders), params) for sql in (
+            _DASHBOARD_RESTAURANTS_IN_SQL, _DASHBOARD_IMAGES_IN_SQL, _DASHBOARD_COPY_IN_SQL)]
+    restaurants, images, copy = execute_batch(statements)
+    bundle = {r['name']: {'restaurant': r, 'images': {}, 'copy': {}} for r in restaurants}
+    for r in images:
+        entry = bundle.get(r.pop('restaurant'))
+        if entry is not None:
+            entry['images'][r['field_name']] = r
+    for r in copy:
+        entry = bundle.get(r['restaurant'])
+        if entry is not None:
+            entry['copy'][r['section_id']] = r['content']
+    return bundle